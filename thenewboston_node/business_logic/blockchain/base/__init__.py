@@ -1,14 +1,17 @@
 from datetime import datetime
-from typing import Type, TypeVar
+from typing import Optional, Type, TypeVar
 
 from django.conf import settings
 
+from thenewboston_node.business_logic.models import Node, PrimaryValidatorSchedule
+from thenewboston_node.core.utils.collections import LRUCache
 from thenewboston_node.core.utils.importing import import_from_string
+from thenewboston_node.core.utils.types import hexstr
 
 from .account_state import AccountStateMixin
 from .blockchain_state import BlockchainStateMixin
 from .blocks import BlocksMixin
-from .network import NetworkMixin
+from .network import PRIMARY_VALIDATOR_CACHE_SIZE, NetworkMixin
 from .validation import ValidationMixin
 
 T = TypeVar('T', bound='BlockchainBase')
@@ -21,6 +24,15 @@ class BlockchainBase(ValidationMixin, BlockchainStateMixin, BlocksMixin, Account
 
     def __init__(self, snapshot_period_in_blocks=None):
         self.snapshot_period_in_blocks = snapshot_period_in_blocks
+        # Primary validator cache is keyed by (last_block_number, block_number)
+        self._primary_validator_cache = LRUCache(PRIMARY_VALIDATOR_CACHE_SIZE)
+        # Accounts that have declared a node mapped to their nodes as of `_node_accounts_last_block_number`
+        # (lazily populated)
+        self._node_accounts: Optional[dict[hexstr, Node]] = None
+        self._node_accounts_last_block_number: Optional[int] = None
+        # Primary validator schedules ordered by precedence as of `_pv_schedules_last_block_number` (lazily populated)
+        self._pv_schedules: Optional[list[tuple[hexstr, PrimaryValidatorSchedule]]] = None
+        self._pv_schedules_last_block_number: Optional[int] = None
 
     @classmethod
     def get_instance(cls: Type[T]) -> T:
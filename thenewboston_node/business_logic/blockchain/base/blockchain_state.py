@@ -39,6 +39,9 @@ class BlockchainStateMixin(BaseMixin):
     def add_blockchain_state(self, blockchain_state: BlockchainState):
         blockchain_state.validate(is_initial=blockchain_state.is_initial())
         self.persist_blockchain_state(blockchain_state)
+        self._primary_validator_cache.clear()  # type: ignore
+        self._pv_schedules = None
+        self.update_node_accounts_from_blockchain_state(blockchain_state)  # type: ignore
 
     def get_first_blockchain_state(self) -> BlockchainState:
         # Override this method if a particular blockchain implementation can provide a high performance
@@ -69,6 +69,9 @@ class BlocksMixin(BaseMixin):
         # TODO(dmu) HIGH: Validate block_identifier
 
         self.persist_block(block)
+        self._primary_validator_cache.clear()  # type: ignore
+        self.update_primary_validator_schedules_from_block(block)  # type: ignore
+        self.update_node_accounts_from_block(block)  # type: ignore
 
         period = self.snapshot_period_in_blocks  # type: ignore
         if period is not None and (block_number + 1) % period == 0:
@@ -1,13 +1,22 @@
 import logging
 from typing import Optional
 
-from thenewboston_node.business_logic.models import Node
+from thenewboston_node.business_logic.models import Block, BlockchainState, Node, PrimaryValidatorSchedule
+from thenewboston_node.core.utils.constants import SENTINEL
 from thenewboston_node.core.utils.types import hexstr
 
 from .base import BaseMixin
 
 logger = logging.getLogger(__name__)
 
+PRIMARY_VALIDATOR_CACHE_SIZE = 64
+
+
+def get_primary_validator_schedules(block: Block):
+    return [(account_number, account_state.primary_validator_schedule)
+            for account_number, account_state in block.yield_account_states()
+            if account_state.primary_validator_schedule]
+
 
 class NetworkMixin(BaseMixin):
 
@@ -17,41 +26,151 @@ class NetworkMixin(BaseMixin):
         return self.get_account_state_attribute_value(identifier, 'node', on_block_number)
 
     def yield_nodes(self, block_number: Optional[int] = None):
-        known_accounts = set()
-        for account_number, account_state in self.yield_account_states(from_block_number=block_number):
+        last_block_number = self.get_last_block_number()
+        if block_number is None or block_number == last_block_number:
+            # Most recently declared nodes go first (we copy nodes, since the index may be updated meanwhile)
+            yield from reversed(tuple(self.get_node_accounts().values()))
+        else:
+            yield from self._collect_nodes(block_number).values()
+
+    def get_node_accounts(self) -> dict[hexstr, Node]:
+        """Return accounts that have ever declared a node mapped to their current nodes (ordered by the latest
+        declaration)
+        """
+        node_accounts = self._node_accounts  # type: ignore
+        last_block_number = self.get_last_block_number()
+        if node_accounts is None or self._node_accounts_last_block_number != last_block_number:  # type: ignore
+            node_accounts = dict(reversed(self._collect_nodes(last_block_number).items()))
+            self._node_accounts = node_accounts
+            self._node_accounts_last_block_number = last_block_number
+
+        return node_accounts
+
+    def _collect_nodes(self, last_block_number: int) -> dict[hexstr, Node]:
+        """Return account number to node map as of `last_block_number` (most recently declared nodes go first)
+        collected in a single pass over blocks and blockchain state
+        """
+        nodes: dict[hexstr, Node] = {}
+        blockchain_state = self.get_blockchain_state_by_block_number(
+            last_block_number, inclusive=last_block_number > -1
+        )
+        for block in self.yield_blocks_slice_reversed(last_block_number, blockchain_state.get_last_block_number()):
+            for account_number, account_state in block.yield_account_states():
+                node = account_state.node
+                if node:
+                    nodes.setdefault(account_number, node)
+
+        for account_number, node in blockchain_state.get_nodes().items():
+            nodes.setdefault(account_number, node)
+
+        return nodes
+
+    def update_node_accounts_from_block(self, block: Block):
+        node_accounts = self._node_accounts  # type: ignore
+        if node_accounts is None:
+            return
+
+        block_number = block.message.block_number
+        if self._node_accounts_last_block_number != block_number - 1:  # type: ignore
+            # Blocks could have been added by another process, so we collect node accounts lazily
+            self._node_accounts = None
+            return
+
+        # Nodes are yielded from the end of the index, so we add them in reverse order to keep the block order
+        for account_number, account_state in reversed(tuple(block.yield_account_states())):
             node = account_state.node
-            if not node:
-                continue
+            if node:
+                # Move the account to the end as the most recently declared
+                node_accounts.pop(account_number, None)
+                node_accounts[account_number] = node
+
+        self._node_accounts_last_block_number = block_number
 
-            if account_number in known_accounts:
-                continue
+    def update_node_accounts_from_blockchain_state(self, blockchain_state: BlockchainState):
+        node_accounts = self._node_accounts  # type: ignore
+        if node_accounts is None:
+            return
 
-            known_accounts.add(account_number)
-            yield node
+        # Blockchain state nodes are declared earlier than (or at the same time as) nodes we already know about
+        new_node_accounts = {
+            account_number: node
+            for account_number, node in blockchain_state.get_nodes().items()
+            if account_number not in node_accounts
+        }
+        if new_node_accounts:
+            self._node_accounts = new_node_accounts | node_accounts
 
     def has_nodes(self):
-        return any(self.yield_nodes())
+        # We do not need to collect node accounts here like get_node_accounts() does
+        last_block_number = self.get_last_block_number()
+        blockchain_state = self.get_blockchain_state_by_block_number(
+            last_block_number, inclusive=last_block_number > -1
+        )
+        if blockchain_state.get_nodes():
+            return True
+
+        for block in self.yield_blocks_slice_reversed(last_block_number, blockchain_state.get_last_block_number()):
+            if any(account_state.node for _, account_state in block.yield_account_states()):
+                return True
+
+        return False
 
     def get_primary_validator(self, block_number: Optional[int] = None) -> Optional[Node]:
         if block_number is None:
             block_number = self.get_next_block_number()
 
-        # We get last_block_number and blockchain_state here to avoid race conditions. Do not change it
+        # We get last_block_number here (and blockchain_state based on it) to avoid race conditions. Do not change it
         last_block_number = self.get_last_block_number()
+
+        cache = self._primary_validator_cache  # type: ignore
+        cache_key = (last_block_number, block_number)
+        primary_validator = cache.get(cache_key, SENTINEL)
+        if primary_validator is SENTINEL:
+            cache[cache_key] = primary_validator = self._get_primary_validator(block_number, last_block_number)
+
+        return primary_validator
+
+    def _get_primary_validator(self, block_number: int, last_block_number: int) -> Optional[Node]:
+        for account_number, pv_schedule in self.get_primary_validator_schedules(last_block_number):
+            if pv_schedule.is_block_number_included(block_number):
+                return self.get_node_by_identifier(account_number, on_block_number=last_block_number)
+
+        return None
+
+    def get_primary_validator_schedules(self, last_block_number: int) -> list[tuple[hexstr, PrimaryValidatorSchedule]]:
+        """Return (account number, primary validator schedule) pairs as of `last_block_number` ordered by
+        precedence: schedules set by the most recent blocks go first, schedules from blockchain state go last
+        """
+        pv_schedules = self._pv_schedules  # type: ignore
+        if pv_schedules is None or self._pv_schedules_last_block_number != last_block_number:  # type: ignore
+            pv_schedules = self._make_primary_validator_schedules(last_block_number)
+            self._pv_schedules = pv_schedules
+            self._pv_schedules_last_block_number = last_block_number
+
+        return pv_schedules
+
+    def _make_primary_validator_schedules(self,
+                                          last_block_number: int) -> list[tuple[hexstr, PrimaryValidatorSchedule]]:
+        pv_schedules = []
         blockchain_state = self.get_blockchain_state_by_block_number(
             last_block_number, inclusive=last_block_number > -1
         )
         for block in self.yield_blocks_slice_reversed(last_block_number, blockchain_state.get_last_block_number()):
-            for account_number, account_state in block.yield_account_states():
-                pv_schedule = account_state.primary_validator_schedule
-                if pv_schedule and pv_schedule.is_block_number_included(block_number):
-                    return self.get_node_by_identifier(account_number)
+            pv_schedules.extend(get_primary_validator_schedules(block))
 
-        # TODO(dmu) HIGH: Once we have more accounts this method will become slow. We need to optimize it
-        #                 by caching
-        for account_number, account_state in blockchain_state.yield_account_states():
-            pv_schedule = account_state.primary_validator_schedule
-            if pv_schedule and pv_schedule.is_block_number_included(block_number):
-                return self.get_node_by_identifier(account_number)
+        pv_schedules.extend(blockchain_state.get_primary_validator_schedules().items())
+        return pv_schedules
 
-        return None
+    def update_primary_validator_schedules_from_block(self, block: Block):
+        pv_schedules = self._pv_schedules  # type: ignore
+        if pv_schedules is None:
+            return
+
+        block_number = block.message.block_number
+        if self._pv_schedules_last_block_number != block_number - 1:  # type: ignore
+            # Blocks could have been added by another process, so we rebuild the schedules lazily
+            self._pv_schedules = None
+            return
+
+        self._pv_schedules = get_primary_validator_schedules(block) + pv_schedules
+        self._pv_schedules_last_block_number = block_number
@@ -1,20 +1,25 @@
+import io
 import logging
 import os.path
 import re
 from collections import namedtuple
+from functools import lru_cache, partial
 from typing import Generator, Optional
+from weakref import WeakValueDictionary
 
 import filelock
 import msgpack
-from cachetools import LRUCache
 from more_itertools import always_reversible, ilen
 
-from thenewboston_node.business_logic.exceptions import BlockchainLockedError, BlockchainUnlockedError
+from thenewboston_node.business_logic.exceptions import (
+    BlockchainLockedError, BlockchainUnlockedError, InvalidBlockchain
+)
 from thenewboston_node.business_logic.models.block import Block
 from thenewboston_node.business_logic.models.blockchain_state import BlockchainState
-from thenewboston_node.business_logic.storages.file_system import COMPRESSION_FUNCTIONS
+from thenewboston_node.business_logic.storages.file_system import KNOWN_COMPRESSION_EXTENSIONS
 from thenewboston_node.business_logic.storages.path_optimized_file_system import PathOptimizedFileSystemStorage
 from thenewboston_node.core.logging import timeit
+from thenewboston_node.core.utils.collections import LRUCache
 from thenewboston_node.core.utils.file_lock import ensure_locked, lock_method
 
 from .base import BlockchainBase
@@ -33,13 +38,13 @@ BLOCKCHAIN_STATE_FILENAME_TEMPLATE = '{last_block_number}-arf.msgpack'
 BLOCKCHAIN_STATE_FILENAME_RE = re.compile(
     BLOCKCHAIN_STATE_FILENAME_TEMPLATE.
     format(last_block_number=r'(?P<last_block_number>\d{,' + str(ORDER_OF_BLOCKCHAIN_STATE_FILE - 1) + r'}(?:!|\d))') +
-    r'(?:|\.(?P<compression>{}))$'.format('|'.join(COMPRESSION_FUNCTIONS.keys()))
+    r'(?:|\.(?P<compression>{}))'.format('|'.join(KNOWN_COMPRESSION_EXTENSIONS))
 )
 
 BLOCK_CHUNK_FILENAME_TEMPLATE = '{start}-{end}-block-chunk.msgpack'
 BLOCK_CHUNK_FILENAME_RE = re.compile(
     BLOCK_CHUNK_FILENAME_TEMPLATE.format(start=r'(?P<start>\d+)', end=r'(?P<end>\d+)') +
-    r'(?:|\.(?P<compression>{}))$'.format('|'.join(COMPRESSION_FUNCTIONS.keys()))
+    r'(?:|\.(?P<compression>{}))'.format('|'.join(KNOWN_COMPRESSION_EXTENSIONS))
 )
 
 DEFAULT_BLOCKCHAIN_STATES_SUBDIR = 'blockchain-states'
@@ -47,6 +52,11 @@ DEFAULT_BLOCKS_SUBDIR = 'blocks'
 
 DEFAULT_BLOCK_CHUNK_SIZE = 100
 
+FILENAME_META_CACHE_SIZE = 4096
+
+# Arrays are decoded to tuples since they are cheaper to construct and block deserialization accepts any iterable
+BLOCK_CHUNK_UNPACK_KWARGS = {'raw': False, 'use_list': False, 'strict_map_key': False}
+
 LOCKED_EXCEPTION = BlockchainLockedError('Blockchain locked. Probably it is being modified by another process')
 EXPECTED_LOCK_EXCEPTION = BlockchainUnlockedError('Blockchain was expected to be locked')
 
@@ -61,8 +71,9 @@ def make_blockchain_state_filename(last_block_number=None):
     return BLOCKCHAIN_STATE_FILENAME_TEMPLATE.format(last_block_number=prefix)
 
 
+@lru_cache(maxsize=FILENAME_META_CACHE_SIZE)
 def get_blockchain_state_filename_meta(filename):
-    match = BLOCKCHAIN_STATE_FILENAME_RE.match(filename)
+    match = BLOCKCHAIN_STATE_FILENAME_RE.fullmatch(filename)
     if match:
         last_block_number_str = match.group('last_block_number')
 
@@ -80,6 +91,10 @@ def get_blockchain_state_file_path_meta(file_path):
     return get_blockchain_state_filename_meta(os.path.basename(file_path))
 
 
+def make_block_chunk_filename_prefix(start: int):
+    return BLOCK_CHUNK_FILENAME_TEMPLATE.partition('{end}')[0].format(start=str(start).zfill(ORDER_OF_BLOCK))
+
+
 def make_block_chunk_filename(start: int, end: int):
     start_block_str = str(start).zfill(ORDER_OF_BLOCK)
     end_block_str = str(end).zfill(ORDER_OF_BLOCK)
@@ -87,9 +102,9 @@ def make_block_chunk_filename(start: int, end: int):
     return BLOCK_CHUNK_FILENAME_TEMPLATE.format(start=start_block_str, end=end_block_str)
 
 
-def get_block_chunk_filename_meta(file_path):
-    filename = os.path.basename(file_path)
-    match = BLOCK_CHUNK_FILENAME_RE.match(filename)
+@lru_cache(maxsize=FILENAME_META_CACHE_SIZE)
+def get_block_chunk_filename_meta(filename):
+    match = BLOCK_CHUNK_FILENAME_RE.fullmatch(filename)
     if match:
         start = int(match.group('start'))
         end = int(match.group('end'))
@@ -99,10 +114,6 @@ def get_block_chunk_filename_meta(file_path):
     return None
 
 
-def get_block_chunk_file_path_meta(file_path):
-    return get_block_chunk_filename_meta(os.path.basename(file_path))
-
-
 class FileBlockchain(BlockchainBase):
 
     def __init__(
@@ -145,11 +156,25 @@ class FileBlockchain(BlockchainBase):
 
         self.blockchain_states_cache: Optional[LRUCache] = None
         self.blocks_cache: Optional[LRUCache] = None
+        self.blocks_weak_cache: Optional[WeakValueDictionary] = None
         self.initialize_caches()
 
+        # Block count is computed by scanning the storage once and then maintained incrementally
+        self._block_count: Optional[int] = None
+        self._counted_last_block_number: Optional[int] = None
+        # Blockchain states count is cached only while we hold the file lock
+        self._blockchain_states_count: Optional[int] = None
+
+        # Sorted (file path, filename meta) pairs of block chunk files (cached only while we are adding a block)
+        self._block_chunk_files: Optional[tuple[tuple[str, BlockChunkFilenameMeta], ...]] = None
+        self._is_block_chunk_files_cache_enabled = False
+
         self._file_lock = None
         self.lock_filename = lock_filename
 
+        # Packer is not thread-safe, so it must be used under the file lock only
+        self._packer = msgpack.Packer()
+
     @property
     def file_lock(self):
         file_lock = self._file_lock
@@ -164,8 +189,17 @@ class FileBlockchain(BlockchainBase):
     @lock_method(lock_attr='file_lock', exception=LOCKED_EXCEPTION)
     def clear(self):
         self.initialize_caches()
+        self._primary_validator_cache.clear()
+        self._node_accounts = None
+        self._pv_schedules = None
+        get_block_chunk_filename_meta.cache_clear()
+        get_blockchain_state_filename_meta.cache_clear()
         self.block_storage.clear()
         self.blockchain_states_storage.clear()
+        self._block_count = 0
+        self._counted_last_block_number = None
+        self._blockchain_states_count = 0
+        self._block_chunk_files = None
 
     def initialize_caches(self):
         self.blockchain_states_cache = LRUCache(self.account_root_files_cache_size)
@@ -174,10 +208,13 @@ class FileBlockchain(BlockchainBase):
             # we use use account root file as a base
             self.snapshot_period_in_blocks * 2 if self.blocks_cache_size is None else self.blocks_cache_size
         )
+        self.blocks_weak_cache = WeakValueDictionary()
 
     # Account root files methods
     @lock_method(lock_attr='file_lock', exception=LOCKED_EXCEPTION)
     def add_blockchain_state(self, blockchain_state: BlockchainState):
+        # Other processes may add blockchain states while we do not hold the lock
+        self._blockchain_states_count = None
         return super().add_blockchain_state(blockchain_state)
 
     @ensure_locked(lock_attr='file_lock', exception=EXPECTED_LOCK_EXCEPTION)
@@ -186,7 +223,10 @@ class FileBlockchain(BlockchainBase):
         last_block_number = blockchain_state.last_block_number
 
         filename = make_blockchain_state_filename(last_block_number)
-        storage.save(filename, blockchain_state.to_messagepack(), is_final=True)
+        storage.save(filename, blockchain_state.to_messagepack(packer=self._packer), is_final=True)
+
+        if self._blockchain_states_count is not None:
+            self._blockchain_states_count += 1
 
     def _load_blockchain_states(self, file_path):
         cache = self.blockchain_states_cache
@@ -213,13 +253,34 @@ class FileBlockchain(BlockchainBase):
         yield from self._yield_blockchain_states(-1)
 
     def get_blockchain_states_count(self) -> int:
-        storage = self.blockchain_states_storage
-        return ilen(storage.list_directory())
+        file_lock = self._file_lock
+        if file_lock is None or not file_lock.is_locked:
+            # Other processes may add blockchain states while we do not hold the lock, so we cannot use the count
+            self._blockchain_states_count = None
+            return self._count_blockchain_states()
+
+        blockchain_states_count = self._blockchain_states_count
+        if blockchain_states_count is None:
+            self._blockchain_states_count = blockchain_states_count = self._count_blockchain_states()
+
+        return blockchain_states_count
+
+    def _count_blockchain_states(self):
+        return ilen(self.blockchain_states_storage.list_directory(sort_direction=None))
 
     # Blocks methods
     @lock_method(lock_attr='file_lock', exception=LOCKED_EXCEPTION)
     def add_block(self, block: Block, validate=True):
-        return super().add_block(block, validate)
+        # Other processes may add blocks while we do not hold the lock, therefore we cache the listing of
+        # block chunk files only until the block is added
+        self._block_chunk_files = None
+        self._is_block_chunk_files_cache_enabled = True
+        self._blockchain_states_count = None
+        try:
+            return super().add_block(block, validate)
+        finally:
+            self._is_block_chunk_files_cache_enabled = False
+            self._block_chunk_files = None
 
     @ensure_locked(lock_attr='file_lock', exception=EXPECTED_LOCK_EXCEPTION)
     def persist_block(self, block: Block):
@@ -240,7 +301,7 @@ class FileBlockchain(BlockchainBase):
         append_filename = make_block_chunk_filename(start=chunk_block_number_start, end=append_end)
         filename = make_block_chunk_filename(start=chunk_block_number_start, end=block_number)
 
-        storage.append(append_filename, block.to_messagepack())
+        storage.append(append_filename, block.to_messagepack(packer=self._packer))
 
         if append_filename != filename:
             storage.move(append_filename, filename)
@@ -248,6 +309,9 @@ class FileBlockchain(BlockchainBase):
         if offset == block_chunk_size - 1:
             storage.finalize(filename)
 
+        self._update_block_count(block_number)
+        self._update_block_chunk_files(filename)
+
     def yield_blocks(self) -> Generator[Block, None, None]:
         yield from self._yield_blocks(1)
 
@@ -256,16 +320,13 @@ class FileBlockchain(BlockchainBase):
         yield from self._yield_blocks(-1)
 
     def yield_blocks_from(self, block_number: int) -> Generator[Block, None, None]:
-        for file_path in self._list_block_directory():
-            meta = get_block_chunk_file_path_meta(file_path)
-            if meta is None:
-                logger.warning('File %s has invalid name format', file_path)
-                continue
-
+        for file_path, meta in self._list_block_directory():
             if meta.end < block_number:
                 continue
 
-            yield from self._yield_blocks_from_file_cached(file_path, direction=1, start=max(meta.start, block_number))
+            yield from self._yield_blocks_from_file_cached(
+                file_path, direction=1, start=max(meta.start, block_number), meta=meta
+            )
 
     def get_block_by_number(self, block_number: int) -> Optional[Block]:
         assert self.blocks_cache
@@ -279,31 +340,73 @@ class FileBlockchain(BlockchainBase):
             return None
 
     def get_block_count(self) -> int:
-        count = 0
-        for file_path in self._list_block_directory():
-            meta = get_block_chunk_file_path_meta(file_path)
-            if meta is None:
-                logger.warning('File %s has invalid name format', file_path)
-                continue
+        block_count = self._block_count
+        if block_count is None or not self._is_block_count_up_to_date():
+            block_count, self._counted_last_block_number = self._count_blocks()
+            self._block_count = block_count
 
+        return block_count
+
+    def _count_blocks(self):
+        count = 0
+        last_block_number = None
+        for _, meta in self._list_block_directory():
             count += meta.end - meta.start + 1
+            if last_block_number is None or meta.end > last_block_number:
+                last_block_number = meta.end
+
+        return count, last_block_number
+
+    def _is_block_count_up_to_date(self):
+        """Check (without listing block chunk files) that no blocks were added after the last counted block,
+        since blocks could have been added by another process
+        """
+        last_block_number = self._counted_last_block_number
+        if last_block_number is None:
+            # There were no blocks, so recounting them is cheap
+            return False
+
+        storage = self.block_storage
+        block_chunk_size = self.block_chunk_size
+        next_block_number = last_block_number + 1
+        if next_block_number % block_chunk_size:
+            # The next block is appended to the last block chunk file, which renames the file
+            chunk_block_number_start = last_block_number - last_block_number % block_chunk_size
+            return storage.exists(make_block_chunk_filename(start=chunk_block_number_start, end=last_block_number))
+
+        # The next block starts a new block chunk file, which could have been appended to (renamed) since then
+        return not storage.has_file_with_prefix(make_block_chunk_filename_prefix(start=next_block_number))
+
+    def _update_block_count(self, block_number):
+        block_count = self._block_count
+        if block_count is None:
+            return
+
+        counted_last_block_number = self._counted_last_block_number
+        expected_block_number = 0 if counted_last_block_number is None else counted_last_block_number + 1
+        if block_number != expected_block_number:
+            # Blocks could have been added by another process since we counted them, so we recount them lazily
+            self._block_count = None
+            return
 
-        return count
+        self._block_count = block_count + 1
+        self._counted_last_block_number = block_number
 
     @timeit(verbose_args=True, is_method=True)
     def _yield_blocks(self, direction) -> Generator[Block, None, None]:
         assert direction in (1, -1)
 
-        for file_path in self._list_block_directory(direction):
-            yield from self._yield_blocks_from_file_cached(file_path, direction)
+        for file_path, meta in self._list_block_directory(direction):
+            yield from self._yield_blocks_from_file_cached(file_path, direction, meta=meta)
 
-    def _yield_blocks_from_file_cached(self, file_path, direction, start=None):
+    def _yield_blocks_from_file_cached(self, file_path, direction, start=None, meta=None):
         assert direction in (1, -1)
 
-        meta = get_block_chunk_file_path_meta(file_path)
         if meta is None:
-            logger.warning('File %s has invalid name format', file_path)
-            return
+            meta = get_block_chunk_filename_meta(os.path.basename(file_path))
+            if meta is None:
+                logger.warning('File %s has invalid name format', file_path)
+                return
 
         file_start = meta.start
         file_end = meta.end
@@ -320,30 +423,86 @@ class FileBlockchain(BlockchainBase):
             yield block
 
         if file_start <= next_block_number <= file_end:
-            yield from self._yield_blocks_from_file(file_path, direction, start=next_block_number)
+            yield from self._yield_blocks_from_file(file_path, direction, start=next_block_number, meta=meta)
 
-    def _yield_blocks_from_file(self, file_path, direction, start=None):
+    def _yield_blocks_from_file(self, file_path, direction, start=None, meta=None):
         assert direction in (1, -1)
-        storage = self.block_storage
 
-        unpacker = msgpack.Unpacker()
-        unpacker.feed(storage.load(file_path))
-        if direction == -1:
-            unpacker = always_reversible(unpacker)
-
-        for block_compact_dict in unpacker:
-            block = Block.from_compact_dict(block_compact_dict)
-            block_number = block.message.block_number
-            # TODO(dmu) HIGH: Implement a better skip
-            if start is not None:
-                if direction == 1 and block_number < start:
-                    continue
-                elif direction == -1 and block_number > start:
-                    continue
+        if meta is None:
+            meta = get_block_chunk_filename_meta(os.path.basename(file_path))
+        if direction == 1:
+            block_unpackers = self._yield_block_unpackers(file_path, meta.start, meta.end)
+        else:
+            block_unpackers = self._yield_block_unpackers_reversed(file_path, meta.start, meta.end)
+
+        blocks_weak_cache = self.blocks_weak_cache
+        for block_number, unpack in block_unpackers:
+            if start is not None and (block_number - start) * direction < 0:
+                continue
+
+            # Blocks evicted from `blocks_cache` may still be alive elsewhere, so we reuse them without decoding
+            block = blocks_weak_cache.get(block_number)
+            if block is None:
+                try:
+                    block_compact_dict = unpack()
+                except msgpack.OutOfData:
+                    break
+
+                block = Block.from_compact_dict(block_compact_dict)
+                if block.message.block_number != block_number:
+                    raise InvalidBlockchain(
+                        f'Block number {block.message.block_number} found at block number {block_number} '
+                        f'position in {file_path}'
+                    )
+
+                blocks_weak_cache[block_number] = block
 
             self.blocks_cache[block_number] = block
             yield block
 
+    def _yield_block_unpackers(self, file_path, start_block_number, end_block_number):
+        with self.block_storage.open_stream(file_path) as fo:
+            unpacker = msgpack.Unpacker(fo, **BLOCK_CHUNK_UNPACK_KWARGS)
+            for block_number in range(start_block_number, end_block_number + 1):
+                offset = unpacker.tell()
+                yield block_number, unpacker.unpack
+                if unpacker.tell() == offset:
+                    # The block was not requested, so we skip it without decoding
+                    try:
+                        unpacker.skip()
+                    except msgpack.OutOfData:
+                        return
+
+    def _yield_block_unpackers_reversed(self, file_path, start_block_number, end_block_number):
+        # Decompressed streams do not support cheap seeking, therefore we index offsets of the blocks without
+        # decoding them and then decode the blocks one by one instead of materializing all of them at once
+        data = self.block_storage.load(file_path)
+        unpacker = msgpack.Unpacker(io.BytesIO(data), **BLOCK_CHUNK_UNPACK_KWARGS)
+        offsets = []
+        while True:
+            offset = unpacker.tell()
+            try:
+                unpacker.skip()
+            except msgpack.OutOfData:
+                break
+
+            offsets.append(offset)
+
+        # The chunk may not be completely written yet, so we number blocks from the start
+        max_block_count = end_block_number - start_block_number + 1
+        if len(offsets) > max_block_count:
+            raise InvalidBlockchain(
+                f'{len(offsets)} blocks found in {file_path}, but it is named as containing {max_block_count} blocks'
+            )
+
+        data_view = memoryview(data)
+        end = len(data)
+        for block_number, offset in zip(
+            range(start_block_number + len(offsets) - 1, start_block_number - 1, -1), reversed(offsets)
+        ):
+            yield block_number, partial(msgpack.unpackb, data_view[offset:end], **BLOCK_CHUNK_UNPACK_KWARGS)
+            end = offset
+
     def _yield_blocks_from_cache(self, start_block_number, end_block_number, direction):
         assert direction in (1, -1)
 
@@ -359,4 +518,40 @@ class FileBlockchain(BlockchainBase):
             yield block
 
     def _list_block_directory(self, direction=1):
-        yield from self.block_storage.list_directory(sort_direction=direction)
+        # Yield parsed filename meta along with file path, so callers do not have to parse it again
+        block_chunk_files = self._block_chunk_files
+        if block_chunk_files is None:
+            block_chunk_files = tuple(self._yield_block_chunk_files())
+            if self._is_block_chunk_files_cache_enabled:
+                self._block_chunk_files = block_chunk_files
+
+        yield from (block_chunk_files if direction == 1 else reversed(block_chunk_files))
+
+    def _yield_block_chunk_files(self):
+        for file_path in self.block_storage.list_directory(sort_direction=1):
+            meta = get_block_chunk_filename_meta(os.path.basename(file_path))
+            if meta is None:
+                logger.warning('File %s has invalid name format', file_path)
+                continue
+
+            yield file_path, meta
+
+    def _update_block_chunk_files(self, filename):
+        block_chunk_files = self._block_chunk_files
+        if block_chunk_files is None:
+            return
+
+        meta = get_block_chunk_filename_meta(filename)
+        if block_chunk_files:
+            _, last_meta = block_chunk_files[-1]
+            if last_meta.end != meta.end - 1:
+                # Unexpected block number, so we list block chunk files again on demand
+                self._block_chunk_files = None
+                return
+
+            if last_meta.start == meta.start:
+                # The block was appended to the last chunk (which was renamed)
+                block_chunk_files = block_chunk_files[:-1]
+
+        # We use tuples to keep iteration over the previous listing unaffected
+        self._block_chunk_files = block_chunk_files + ((filename, meta),)
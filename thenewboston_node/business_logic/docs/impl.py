@@ -88,7 +88,7 @@ def get_context():
             'account_root_file_template': file_blockchain.BLOCKCHAIN_STATE_FILENAME_TEMPLATE,
             'get_block_chunk_filename': file_blockchain.make_block_chunk_filename,
             'get_account_root_filename': file_blockchain.make_blockchain_state_filename,
-            'compressors': file_system.COMPRESSION_FUNCTIONS.keys(),
+            'compressors': file_system.KNOWN_COMPRESSION_EXTENSIONS,
             'file_optimization_max_depth': path_optimized_file_system.DEFAULT_MAX_DEPTH,
             'make_optimized_file_path': path_optimized_file_system.make_optimized_file_path,
         },
@@ -16,9 +16,14 @@ from .account_state import AccountState
 from .base import BaseDataclass
 from .mixins.compactable import MessagpackCompactableMixin
 from .mixins.normalizable import NormalizableMixin
+from .node import Node
+from .signed_change_request_message import PrimaryValidatorSchedule
 
 T = TypeVar('T', bound='BlockchainState')
 
+# Names of attributes that hold indexes derived from `BlockchainState.account_states`
+DERIVED_INDEX_ATTRIBUTES = ('_nodes', '_primary_validator_schedules')
+
 logger = logging.getLogger(__name__)
 
 
@@ -73,9 +78,10 @@ class BlockchainState(MessagpackCompactableMixin, NormalizableMixin, BaseDatacla
         if 'account_states' in dict_ and 'account_states' not in override:
             # Replace null value of node.identifier with account number
             account_states = dict_.pop('account_states')
+            deserialize_account_state = AccountState.deserialize_from_dict
             account_state_objects = {}
             for account_number, account_state in account_states.items():
-                account_state_object = AccountState.deserialize_from_dict(account_state)
+                account_state_object = deserialize_account_state(account_state)
                 if (node := account_state_object.node) and node.identifier is None:
                     node.identifier = account_number
                 account_state_objects[account_number] = account_state_object
@@ -85,16 +91,33 @@ class BlockchainState(MessagpackCompactableMixin, NormalizableMixin, BaseDatacla
         return super().deserialize_from_dict(dict_, override=override)
 
     def serialize_to_dict(self, skip_none_values=True, coerce_to_json_types=True, exclude=()):
-        serialized = super().serialize_to_dict(
-            skip_none_values=skip_none_values, coerce_to_json_types=coerce_to_json_types, exclude=exclude
-        )
-        for account_number, account_state in serialized['account_states'].items():
-            if account_state.get('balance_lock') == account_number:
-                del account_state['balance_lock']
+        if 'account_states' in exclude:
+            return super().serialize_to_dict(
+                skip_none_values=skip_none_values, coerce_to_json_types=coerce_to_json_types, exclude=exclude
+            )
 
-            if node := account_state.get('node'):
+        # There may be a lot of account states, so we serialize them directly (instead of generic field
+        # serialization) and strip redundant values in the same pass
+        serialized_account_states = {}
+        for account_number, account_state in self.account_states.items():
+            serialized_account_state = account_state.serialize_to_dict(
+                skip_none_values=skip_none_values,
+                coerce_to_json_types=coerce_to_json_types,
+                exclude=('balance_lock',) if account_state.balance_lock == account_number else (),
+            )
+            if node := serialized_account_state.get('node'):
                 node.pop('identifier', None)
 
+            serialized_account_states[account_number] = serialized_account_state
+
+        serialized = {'account_states': serialized_account_states}
+        serialized.update(
+            super().serialize_to_dict(
+                skip_none_values=skip_none_values,
+                coerce_to_json_types=coerce_to_json_types,
+                exclude=(*exclude, 'account_states')
+            )
+        )
         return serialized
 
     def yield_account_states(self) -> Generator[tuple[hexstr, AccountState], None, None]:
@@ -105,6 +128,45 @@ class BlockchainState(MessagpackCompactableMixin, NormalizableMixin, BaseDatacla
 
     def set_account_state(self, account: hexstr, account_state: AccountState):
         self.account_states[account] = account_state
+        self.invalidate_derived_indexes()
+
+    def get_nodes(self) -> dict[hexstr, Node]:
+        """Return account number to node map for accounts that have declared a node"""
+        nodes = getattr(self, '_nodes', None)
+        if nodes is None:
+            self._nodes = nodes = {
+                account_number: account_state.node
+                for account_number, account_state in self.account_states.items()
+                if account_state.node
+            }
+
+        return nodes
+
+    def get_primary_validator_schedules(self) -> dict[hexstr, PrimaryValidatorSchedule]:
+        """Return account number to primary validator schedule map for accounts that have the schedule"""
+        pv_schedules = getattr(self, '_primary_validator_schedules', None)
+        if pv_schedules is None:
+            self._primary_validator_schedules = pv_schedules = {
+                account_number: account_state.primary_validator_schedule
+                for account_number, account_state in self.account_states.items()
+                if account_state.primary_validator_schedule
+            }
+
+        return pv_schedules
+
+    def invalidate_derived_indexes(self):
+        # `account_states` remains the source of truth, indexes are derived from it. In-place changes of
+        # account states are not tracked, so this method must be called explicitly after them
+        for attribute in DERIVED_INDEX_ATTRIBUTES:
+            self.__dict__.pop(attribute, None)
+
+    def __getstate__(self):
+        # Copies are usually modified in place, so we do not copy derived indexes
+        state = self.__dict__.copy()
+        for attribute in DERIVED_INDEX_ATTRIBUTES:
+            state.pop(attribute, None)
+
+        return state
 
     def get_account_state_attribute_value(self, account: hexstr, attribute: str):
         account_state = self.get_account_state(account)
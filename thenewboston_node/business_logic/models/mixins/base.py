@@ -6,6 +6,7 @@ from thenewboston_node.core.utils.typing import unwrap_optional
 
 class BaseMixin:
     _field_cache: typing.ClassVar = {}
+    _field_type_cache: typing.ClassVar = {}
 
     @classmethod
     def get_fields(cls):
@@ -25,9 +26,13 @@ class BaseMixin:
 
     @classmethod
     def get_field_type(cls, field_name):
-        type_ = cls.get_field(field_name).type
-        type_ = unwrap_optional(type_)
-        assert type_ is not typing.Union, 'Multitype fields are not supported'
+        field_types = cls._field_type_cache.setdefault(cls, {})
+        type_ = field_types.get(field_name)
+        if type_ is None:
+            type_ = cls.get_field(field_name).type
+            type_ = unwrap_optional(type_)
+            assert type_ is not typing.Union, 'Multitype fields are not supported'
+            field_types[field_name] = type_
 
         return type_
 
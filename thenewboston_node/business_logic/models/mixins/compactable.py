@@ -1,9 +1,11 @@
 import logging
 import typing
+from functools import lru_cache, partial
+from typing import Any, Callable, Optional
 
 import msgpack
 
-from thenewboston_node.business_logic.validators import validate_not_none
+from thenewboston_node.business_logic.exceptions import ValidationError
 from thenewboston_node.core.utils.collections import replace_keys
 from thenewboston_node.core.utils.types import hexstr
 
@@ -69,32 +71,39 @@ def get_type_uncompact_transform_map():
     }
 
 
-def transform_value(value, type_, transform_map):
-    type_origin = typing.get_origin(type_)
-    type_args = typing.get_args(type_)
-
+@lru_cache(maxsize=None)
+def get_value_transformer(type_, compact: bool) -> Optional[Callable[[Any], Any]]:
+    """Return `func(value)` transforming values of `type_` to compact values (if `compact` is true) or from
+    compact values (otherwise), or `None` if values of `type_` are not transformed. Transformers are built once
+    per type, so we do not dispatch on type for every transformed value.
+    """
+    transform_map = get_type_compact_transform_map() if compact else get_type_uncompact_transform_map()
     for transform_type, transform_func in transform_map.items():
         if issubclass(type_, transform_type):
-            return transform_func(type_, value)
+            return partial(transform_func, type_)
 
+    type_origin = typing.get_origin(type_)
     if type_origin and issubclass(type_origin, dict):
-        new_value = {}
-        for item_key, item_value in value.items():
-            item_key_type, item_value_type = type_args
-
-            item_key = transform_value(item_key, item_key_type, transform_map)
-            item_value = transform_value(item_value, item_value_type, transform_map)
-            new_value[item_key] = item_value
-        return new_value
+        item_key_type, item_value_type = typing.get_args(type_)
+        transform_key = get_value_transformer(item_key_type, compact)
+        transform_item = get_value_transformer(item_value_type, compact)
+        if transform_key is None and transform_item is None:
+            return None
+
+        transform_key = transform_key or (lambda value: value)
+        transform_item = transform_item or (lambda value: value)
+        return lambda value: {
+            transform_key(item_key): transform_item(item_value) for item_key, item_value in value.items()
+        }
     elif type_origin and issubclass(type_origin, list):
-        new_value = []
-        for item in value:
-            item_type = type_args[0]
-            item_value = transform_value(item, item_type, transform_map)
-            new_value.append(item_value)
-        return new_value
-    else:
-        return value
+        (item_type,) = typing.get_args(type_)
+        transform_item = get_value_transformer(item_type, compact)
+        if transform_item is None:
+            return None
+
+        return lambda value: [transform_item(item) for item in value]
+
+    return None
 
 
 class CompactableMixin(SerializableMixin):
@@ -123,22 +132,24 @@ class CompactableMixin(SerializableMixin):
 
     @classmethod
     def to_compact_values(cls, dict_):
-        return cls._transform_dict(dict_, transform_map=get_type_compact_transform_map())
+        return cls._transform_dict(dict_, compact=True)
 
     @classmethod
     def from_compact_values(cls, dict_):
-        return cls._transform_dict(dict_, transform_map=get_type_uncompact_transform_map())
+        return cls._transform_dict(dict_, compact=False)
 
     @classmethod
-    def _transform_dict(cls, dict_, transform_map):
+    def _transform_dict(cls, dict_, compact):
         field_types = cls.get_field_types(dict_)
 
         new_dict = {}
         for key, value in dict_.items():
             type_ = field_types.get(key)
-            validate_not_none(f'{cls.__name__} {key} type', type_)
-            value = transform_value(value, type_, transform_map)
-            new_dict[key] = value
+            if type_ is None:
+                raise ValidationError(f'{cls.__name__} {key} type must be set')
+
+            transform = get_value_transformer(type_, compact)
+            new_dict[key] = value if transform is None else transform(value)
 
         return new_dict
 
@@ -154,6 +165,10 @@ class MessagpackCompactableMixin(CompactableMixin):
         unpacked = msgpack.unpackb(messagepack_binary)
         return cls.from_compact_dict(unpacked, compact_keys=compact_keys, compact_values=compact_values)
 
-    def to_messagepack(self, compact_keys=True, compact_values=True):
+    def to_messagepack(self, compact_keys=True, compact_values=True, packer: typing.Optional[msgpack.Packer] = None):
         compact_dict = self.to_compact_dict(compact_keys=compact_keys, compact_values=compact_values)
-        return msgpack.packb(compact_dict)
+        if packer is None:
+            return msgpack.packb(compact_dict)
+
+        # Reusing a packer saves us from allocating its internal buffer for every packed object
+        return packer.pack(compact_dict)
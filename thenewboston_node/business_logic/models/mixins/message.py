@@ -8,13 +8,49 @@ from .normalizable import NormalizableMixin
 
 logger = logging.getLogger(__name__)
 
+CACHE_ATTRIBUTES = ('_hash_cache', '_normalized_cache')
+
 
 class MessageMixin(NormalizableMixin):
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Assigning a field invalidates the cached hash and normalized message. In-place changes of nested values
+        # are not tracked, so `invalidate_hash_cache()` must be called explicitly after them
+        self.invalidate_hash_cache()
+
+    def invalidate_hash_cache(self):
+        dict_ = self.__dict__
+        for attribute in CACHE_ATTRIBUTES:
+            dict_.pop(attribute, None)
+
+    def __getstate__(self):
+        # Copies are usually modified in place (which is not tracked), so we do not copy cached values
+        state = self.__dict__.copy()
+        for attribute in CACHE_ATTRIBUTES:
+            state.pop(attribute, None)
+
+        return state
+
+    def get_normalized(self) -> bytes:
+        # Hashing and signing (or signature validation) of the same message share the normalized representation
+        normalized_message = self.__dict__.get('_normalized_cache')
+        if normalized_message is None:
+            normalized_message = super().get_normalized()
+            # Bypass `__setattr__()` to keep the cached normalized message
+            self.__dict__['_normalized_cache'] = normalized_message
+
+        return normalized_message
+
     def get_hash(self) -> hexstr:
-        normalized_message = self.get_normalized()
-        message_hash = hash_normalized_dict(normalized_message)
-        logger.debug('Got %s hash for message: %r', message_hash, normalized_message)
+        message_hash = self.__dict__.get('_hash_cache')
+        if message_hash is None:
+            normalized_message = self.get_normalized()
+            message_hash = hash_normalized_dict(normalized_message)
+            logger.debug('Got %s hash for message: %r', message_hash, normalized_message)
+            # Bypass `__setattr__()` to keep the cached hash
+            self.__dict__['_hash_cache'] = message_hash
+
         return message_hash
 
     def generate_signature(self, signing_key: hexstr):
@@ -3,5 +3,8 @@ from thenewboston_node.core.utils.cryptography import normalize_dict
 
 class NormalizableMixin:
 
+    def get_normalizable_dict(self) -> dict:
+        return self.serialize_to_dict()  # type: ignore
+
     def get_normalized(self) -> bytes:
-        return normalize_dict(self.serialize_to_dict())  # type: ignore
+        return normalize_dict(self.get_normalizable_dict())
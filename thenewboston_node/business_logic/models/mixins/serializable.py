@@ -1,5 +1,7 @@
 import typing
-from typing import Any, Optional
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, NamedTuple, Optional
 
 from thenewboston_node.business_logic.exceptions import ValidationError
 from thenewboston_node.core.utils.misc import coerce_from_json_type, coerce_to_json_type
@@ -7,96 +9,197 @@ from thenewboston_node.core.utils.misc import coerce_from_json_type, coerce_to_j
 from .base import BaseMixin
 
 
-def serialize_value(value, skip_none_values, coerce_to_json_types):  # noqa: C901
+class FieldsCodec(NamedTuple):
+    required_field_names: frozenset[str]
+    serializers: tuple[tuple[str, Optional[Callable[[Any, bool, bool], Any]]], ...]
+    deserializers: dict[str, Optional[Callable[[Any, bool], Any]]]
+
+
+def serialize_inner_value(item: Any, skip_none_values: bool, coerce_to_json_types: bool) -> Any:
+    if isinstance(item, SerializableMixin):
+        return item.serialize_to_dict(skip_none_values=skip_none_values, coerce_to_json_types=coerce_to_json_types)
+
+    return coerce_to_json_type(item) if coerce_to_json_types else item
+
+
+def serialize_value(value: Any, skip_none_values: bool, coerce_to_json_types: bool) -> Any:
     if isinstance(value, SerializableMixin):
         value = value.serialize_to_dict(skip_none_values=skip_none_values, coerce_to_json_types=coerce_to_json_types)
     elif isinstance(value, list):
-        new_value = []
-        for item in value:
-            if isinstance(item, SerializableMixin):
-                item = item.serialize_to_dict(
-                    skip_none_values=skip_none_values, coerce_to_json_types=coerce_to_json_types
-                )
-            elif coerce_to_json_types:
-                item = coerce_to_json_type(item)
-
-            new_value.append(item)
-
-        value = new_value
+        value = [serialize_inner_value(item, skip_none_values, coerce_to_json_types) for item in value]
     elif isinstance(value, dict):
-        new_value = {}
-        for item_key, item_value in value.items():
-            if isinstance(item_key, SerializableMixin):
-                item_key = item_key.serialize_to_dict(
-                    skip_none_values=skip_none_values, coerce_to_json_types=coerce_to_json_types
-                )
-            elif coerce_to_json_types:
-                item_key = coerce_to_json_type(item_key)
-
-            if isinstance(item_value, SerializableMixin):
-                item_value = item_value.serialize_to_dict(
-                    skip_none_values=skip_none_values, coerce_to_json_types=coerce_to_json_types
-                )
-            elif coerce_to_json_types:
-                item_value = coerce_to_json_type(item_value)
-
-            new_value[item_key] = item_value
-
-        value = new_value
+        value = {
+            serialize_inner_value(item_key, skip_none_values, coerce_to_json_types):
+            serialize_inner_value(item_value, skip_none_values, coerce_to_json_types)
+            for item_key, item_value in value.items()
+        }
     elif coerce_to_json_types:
         value = coerce_to_json_type(value)
 
     return value
 
 
+def is_json_coercible_type(type_: type) -> bool:
+    # Keep in sync with `coerce_to_json_type()` / `coerce_from_json_type()`
+    return issubclass(type_, datetime)
+
+
+def make_value_serializer(type_: Any) -> Optional[Callable[[Any, bool, bool], Any]]:  # noqa: C901
+    """Return `func(value, skip_none_values, coerce_to_json_types)` serializing values of `type_` or `None` if
+    values of `type_` do not require serialization (scalars).
+    """
+    origin = typing.get_origin(type_)
+    if origin is None:
+        if not isinstance(type_, type):
+            return serialize_value  # unsupported type annotation: fallback to runtime type dispatch
+
+        if issubclass(type_, SerializableMixin):
+            return lambda value, skip_none_values, coerce_to_json_types: value.serialize_to_dict(
+                skip_none_values=skip_none_values, coerce_to_json_types=coerce_to_json_types
+            )
+
+        if is_json_coercible_type(type_):
+            return lambda value, skip_none_values, coerce_to_json_types: (
+                coerce_to_json_type(value) if coerce_to_json_types else value
+            )
+
+        return None
+
+    if issubclass(origin, list):
+        (item_type,) = typing.get_args(type_)
+        serialize_item = make_value_serializer(item_type)
+        if serialize_item is None:
+            return lambda value, skip_none_values, coerce_to_json_types: list(value)
+
+        return lambda value, skip_none_values, coerce_to_json_types: [
+            serialize_item(item, skip_none_values, coerce_to_json_types) for item in value
+        ]
+
+    if issubclass(origin, dict):
+        item_key_type, item_value_type = typing.get_args(type_)
+        serialize_key = make_value_serializer(item_key_type)
+        serialize_item = make_value_serializer(item_value_type)
+        if serialize_key is None and serialize_item is None:
+            return lambda value, skip_none_values, coerce_to_json_types: dict(value)
+
+        serialize_key = serialize_key or (lambda value, skip_none_values, coerce_to_json_types: value)
+        serialize_item = serialize_item or (lambda value, skip_none_values, coerce_to_json_types: value)
+        return lambda value, skip_none_values, coerce_to_json_types: {
+            serialize_key(item_key, skip_none_values, coerce_to_json_types):
+            serialize_item(item_value, skip_none_values, coerce_to_json_types)
+            for item_key, item_value in value.items()
+        }
+
+    return serialize_value
+
+
+def make_value_deserializer(type_: Any) -> Optional[Callable[[Any, bool], Any]]:
+    """Return `func(value, complain_excessive_keys)` deserializing values of `type_` or `None` if values
+    of `type_` do not require deserialization (scalars).
+    """
+    origin = typing.get_origin(type_)
+    if origin is None:
+        if not isinstance(type_, type):
+            return None
+
+        if issubclass(type_, SerializableMixin):
+            return lambda value, complain_excessive_keys: type_.deserialize_from_dict(
+                value, complain_excessive_keys=complain_excessive_keys
+            )
+
+        if is_json_coercible_type(type_):
+            return lambda value, complain_excessive_keys: coerce_from_json_type(value, type_)
+
+        return None
+
+    if issubclass(origin, list):
+        (item_type,) = typing.get_args(type_)
+        deserialize_item = make_value_deserializer(item_type)
+        if deserialize_item is None:
+            return lambda value, complain_excessive_keys: list(value)
+
+        return lambda value, complain_excessive_keys: [
+            deserialize_item(item, complain_excessive_keys) for item in value
+        ]
+
+    if issubclass(origin, dict):
+        item_key_type, item_value_type = typing.get_args(type_)
+        deserialize_key = make_value_deserializer(item_key_type) or (lambda value, complain_excessive_keys: value)
+        deserialize_item = make_value_deserializer(item_value_type) or (lambda value, complain_excessive_keys: value)
+        return lambda value, complain_excessive_keys: {
+            deserialize_key(item_key, complain_excessive_keys): deserialize_item(item_value, complain_excessive_keys)
+            for item_key, item_value in value.items()
+        }
+
+    return None
+
+
 class SerializableMixin(BaseMixin):
+    _codec_cache: typing.ClassVar = {}
 
     @staticmethod
     def deserialize_from_inner_list(field_type, value, complain_excessive_keys):
         (item_type,) = typing.get_args(field_type)
-        new_value = []
-        for item in value:
-            if issubclass(item_type, SerializableMixin):
-                item = item_type.deserialize_from_dict(item, complain_excessive_keys=complain_excessive_keys)
-            else:
-                item = coerce_from_json_type(item, item_type)
-
-            new_value.append(item)
+        if issubclass(item_type, SerializableMixin):
+            return [
+                item_type.deserialize_from_dict(item, complain_excessive_keys=complain_excessive_keys)
+                for item in value
+            ]
 
-        return new_value
+        return [coerce_from_json_type(item, item_type) for item in value]
 
     @staticmethod
     def deserialize_from_inner_dict(field_type, value, complain_excessive_keys, item_values_override=None):
         item_values_override = item_values_override or {}
 
-        new_value = {}
         item_key_type, item_value_type = typing.get_args(field_type)
-        for item_key, item_value in value.items():
-            item_key_original = item_key
-            if issubclass(item_key_type, SerializableMixin):
-                item_key = item_key_type.deserialize_from_dict(
-                    item_key, complain_excessive_keys=complain_excessive_keys
-                )
-            else:
-                item_key = coerce_from_json_type(item_key, item_key_type)
-
-            if issubclass(item_value_type, SerializableMixin):
-                item_value = item_value_type.deserialize_from_dict(
+        if issubclass(item_key_type, SerializableMixin):
+            deserialize_key = partial(
+                item_key_type.deserialize_from_dict, complain_excessive_keys=complain_excessive_keys
+            )
+        else:
+            deserialize_key = partial(coerce_from_json_type, type_=item_key_type)
+
+        if issubclass(item_value_type, SerializableMixin):
+            deserialize_from_dict = item_value_type.deserialize_from_dict
+            return {
+                deserialize_key(item_key): deserialize_from_dict(
                     item_value,
                     complain_excessive_keys=complain_excessive_keys,
-                    override=item_values_override.get(item_key_original)
-                )
-            else:
-                item_value = coerce_from_json_type(item_value, item_value_type)
+                    override=item_values_override.get(item_key)
+                ) for item_key, item_value in value.items()
+            }
 
-            new_value[item_key] = item_value
+        return {
+            deserialize_key(item_key): coerce_from_json_type(item_value, item_value_type)
+            for item_key, item_value in value.items()
+        }
 
-        return new_value
+    @classmethod
+    def get_codec(cls):
+        """Return field (de)serializers resolved once per class, so we do not have to dispatch on field types
+        for every (de)serialized instance.
+        """
+        codec = cls._codec_cache.get(cls)
+        if codec is None:
+            field_names = tuple(cls.get_field_names())
+            codec = FieldsCodec(
+                required_field_names=frozenset(
+                    field_name for field_name in field_names if not cls.is_optional_field(field_name)
+                ),
+                serializers=tuple(
+                    (field_name, make_value_serializer(cls.get_field_type(field_name))) for field_name in field_names
+                ),
+                deserializers={
+                    field_name: make_value_deserializer(cls.get_field_type(field_name)) for field_name in field_names
+                },
+            )
+            cls._codec_cache[cls] = codec
+
+        return codec
 
     @classmethod
-    def deserialize_from_dict(
-        cls, dict_, complain_excessive_keys=True, override: Optional[dict[str, Any]] = None
-    ):  # noqa: C901
+    def deserialize_from_dict(cls, dict_, complain_excessive_keys=True, override: Optional[dict[str, Any]] = None):
         """Return instance deserialized from `dict_`.
         Args:
             dict_ (dict): dict object to be deserialized from
@@ -104,37 +207,26 @@ class SerializableMixin(BaseMixin):
             override (dict): a dict of values that have already been deserialized
         """
         override = override or {}
-        field_names = set(cls.get_field_names())
-        missing_keys = [
-            key for key in field_names - dict_.keys() if key not in override and not cls.is_optional_field(key)
-        ]
+        codec = cls.get_codec()
+        missing_keys = [key for key in codec.required_field_names - dict_.keys() if key not in override]
         if missing_keys:
             raise ValidationError('Missing keys: {}'.format(', '.join(missing_keys)))
 
+        deserializers = codec.deserializers
         deserialized = {}
         for key, value in dict_.items():
             if key in override:
                 continue
 
-            if key not in field_names:
+            try:
+                deserialize = deserializers[key]
+            except KeyError:
                 if complain_excessive_keys:
                     raise ValidationError(f'Unknown key: {key}')
                 else:
                     continue
 
-            field_type = cls.get_field_type(key)
-            if issubclass(field_type, SerializableMixin):
-                value = field_type.deserialize_from_dict(value, complain_excessive_keys=complain_excessive_keys)
-            else:
-                origin = typing.get_origin(field_type)
-                if origin and issubclass(origin, list):
-                    value = cls.deserialize_from_inner_list(field_type, value, complain_excessive_keys)
-                elif origin and issubclass(origin, dict):
-                    value = cls.deserialize_from_inner_dict(field_type, value, complain_excessive_keys)
-                else:
-                    value = coerce_from_json_type(value, field_type)
-
-            deserialized[key] = value
+            deserialized[key] = value if deserialize is None else deserialize(value, complain_excessive_keys)
 
         deserialized.update(override)
 
@@ -142,14 +234,17 @@ class SerializableMixin(BaseMixin):
 
     def serialize_to_dict(self, skip_none_values=True, coerce_to_json_types=True, exclude=()):
         serialized = {}
-        for field_name in self.get_field_names():
-            if field_name in exclude:
+        for field_name, serialize in self.get_codec().serializers:
+            if exclude and field_name in exclude:
                 continue
 
             value = getattr(self, field_name)
-            if value is None and skip_none_values:
-                continue
+            if value is None:
+                if skip_none_values:
+                    continue
+            elif serialize is not None:
+                value = serialize(value, skip_none_values, coerce_to_json_types)
 
-            serialized[field_name] = serialize_value(value, skip_none_values, coerce_to_json_types)
+            serialized[field_name] = value
 
         return serialized
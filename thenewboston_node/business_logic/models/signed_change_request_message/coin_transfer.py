@@ -5,7 +5,6 @@ from typing import Type, TypeVar
 from thenewboston_node.business_logic.models.node import PrimaryValidator, RegularNode
 from thenewboston_node.business_logic.validators import validate_not_empty, validate_type
 from thenewboston_node.core.logging import validates
-from thenewboston_node.core.utils.cryptography import normalize_dict
 from thenewboston_node.core.utils.dataclass import cover_docstring, revert_docstring
 from thenewboston_node.core.utils.types import hexstr
 
@@ -68,7 +67,7 @@ class CoinTransferSignedChangeRequestMessage(SignedChangeRequestMessage):
     def get_amount(self, recipient):
         return sum(tx.amount for tx in self.txs if tx.recipient == recipient)
 
-    def get_normalized(self) -> bytes:
+    def get_normalizable_dict(self) -> dict:
         message_dict = self.serialize_to_dict()  # type: ignore
 
         for tx in message_dict['txs']:
@@ -78,7 +77,7 @@ class CoinTransferSignedChangeRequestMessage(SignedChangeRequestMessage):
             message_dict['txs'], key=lambda x: (x['recipient'], x.get('is_fee', False), x['amount'])
         )
 
-        return normalize_dict(message_dict)
+        return message_dict
 
     @validates('transfer request message')
     def validate(self):
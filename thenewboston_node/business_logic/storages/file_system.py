@@ -2,15 +2,36 @@ import bz2
 import gzip
 import logging
 import lzma
+import mmap
 import os
 import shutil
 import stat
+import tempfile
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import ExitStack, contextmanager
+from functools import partial
 from pathlib import Path
-from typing import Union
+from typing import BinaryIO, Optional, Union
+
+from atomicwrites import replace_atomic
 
 from thenewboston_node.business_logic import exceptions
 from thenewboston_node.core.logging import timeit_method
 from thenewboston_node.core.utils.atomic_write import atomic_write_append
+from thenewboston_node.core.utils.collections import LRUCache
+from thenewboston_node.core.utils.os import remove_quite
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
 
 # TODO(dmu) LOW: Support more / better compression methods
 COMPRESSION_FUNCTIONS = {
@@ -19,21 +40,179 @@ COMPRESSION_FUNCTIONS = {
     'xz': lzma.compress
 }
 
+
+class CompressorWriter:
+    """
+    Write-only file object compressing data written to it with `compressor` (an object with `compress()` and
+    `flush()` methods) to the given file object. It is lighter than `gzip.GzipFile` and alike, since we only
+    need to write the whole data once
+    """
+
+    def __init__(self, fo, compressor):
+        self.fo = fo
+        self.compressor = compressor
+
+    def write(self, data):
+        self.fo.write(self.compressor.compress(data))
+
+    def close(self):
+        self.fo.write(self.compressor.flush())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+
+
+# Functions returning file objects compressing data written to them to the given (uncompressed) file object
+COMPRESSION_WRITER_FUNCTIONS = {
+    # 31 window bits makes zlib produce gzip format (zlib also computes checksum in C)
+    'gz': lambda fo: CompressorWriter(fo, zlib.compressobj(9, zlib.DEFLATED, 31)),
+    'bz2': lambda fo: CompressorWriter(fo, bz2.BZ2Compressor(9)),
+    'xz': lambda fo: CompressorWriter(fo, lzma.LZMACompressor()),
+}
+
+# Higher levels compress marginally better, but much slower
+ZSTD_COMPRESSION_LEVEL = 10
+
+
+def decompress_gzip(data):
+    """Decompress gzip data with a single zlib call (unlike `gzip.decompress()` that reads it with `GzipFile`
+    chunk by chunk)
+    """
+    # 31 window bits makes zlib expect gzip format
+    decompressor = zlib.decompressobj(31)
+    decompressed = decompressor.decompress(data)
+    if decompressor.unused_data or not decompressor.eof:
+        # Data consists of several gzip members (zlib stops after the first one), so we need to decompress them one
+        # by one (truncated data is reported by `gzip.decompress()` too)
+        return gzip.decompress(data)
+
+    return decompressed
+
+
 DECOMPRESSION_FUNCTIONS = {
-    'gz': gzip.decompress,
+    'gz': decompress_gzip,
     'bz2': bz2.decompress,
     'xz': lzma.decompress,
 }
 
+DECOMPRESSION_OPEN_FUNCTIONS = {
+    'gz': gzip.open,
+    'bz2': bz2.open,
+    'xz': lzma.open,
+}
+
+if zstandard:
+
+    def decompress_zstd(data, dict_data=None):
+        # Data may consist of several frames if it was appended frame by frame
+        with zstandard.ZstdDecompressor(dict_data=dict_data).stream_reader(data, read_across_frames=True) as reader:
+            return reader.readall()
+
+    def open_zstd(path, mode='rb', dict_data=None):
+        assert mode == 'rb'
+        return zstandard.ZstdDecompressor(dict_data=dict_data).stream_reader(open(path, mode), read_across_frames=True)
+
+    def open_zstd_writer(fo, dict_data=None):
+        compressor = zstandard.ZstdCompressor(level=ZSTD_COMPRESSION_LEVEL, dict_data=dict_data)
+        return compressor.stream_writer(fo, closefd=False)
+
+    # zstd goes first, so it wins ties on compression (it is the fastest to decompress)
+    COMPRESSION_FUNCTIONS = {
+        'zst': lambda data: zstandard.ZstdCompressor(level=ZSTD_COMPRESSION_LEVEL).compress(data),
+        **COMPRESSION_FUNCTIONS,
+    }
+    COMPRESSION_WRITER_FUNCTIONS['zst'] = open_zstd_writer
+    DECOMPRESSION_FUNCTIONS = {
+        'zst': decompress_zstd,
+        **DECOMPRESSION_FUNCTIONS,
+    }
+    DECOMPRESSION_OPEN_FUNCTIONS = {
+        'zst': open_zstd,
+        **DECOMPRESSION_OPEN_FUNCTIONS,
+    }
+
+# Compressors requiring optional packages (zstandard, lz4) are opt-in, so nodes produce files that any node can read
+DEFAULT_COMPRESSORS = ('gz', 'bz2', 'xz')
+
+# Appended data is compressed with this compressor frame by frame (if framed append is enabled for the storage), so
+# finalization does not need to reread and recompress the whole file
+FRAMED_COMPRESSOR = 'zst'
+FRAMED_COMPRESSION_LEVEL = 3
+
+if lz4:
+    # LZ4 is a speed tier: it compresses worse than others, so it is not among default compressors
+    COMPRESSION_FUNCTIONS['lz4'] = lz4.frame.compress
+    COMPRESSION_WRITER_FUNCTIONS['lz4'] = lambda fo: lz4.frame.LZ4FrameFile(fo, mode='wb')
+    DECOMPRESSION_FUNCTIONS['lz4'] = lz4.frame.decompress
+    DECOMPRESSION_OPEN_FUNCTIONS['lz4'] = lz4.frame.open
+
+# Files are looked up with all known compression extensions (in this order), even if an optional package required
+# to decompress them is not installed, so such files are not mistaken for missing ones
+KNOWN_COMPRESSION_EXTENSIONS = ('zst', 'gz', 'bz2', 'xz', 'lz4')
+COMPRESSION_EXTENSIONS = frozenset(KNOWN_COMPRESSION_EXTENSIONS)
+
+# Compressors in the order of preference for each speed tier (the first available one is used)
+SPEED_TIER_COMPRESSORS = {
+    'fast': ('lz4', 'zst', 'gz'),
+    'balanced': ('zst', 'gz'),
+}
+
+# Compression functions release GIL, so candidate compressions can run concurrently
+compression_executor = ThreadPoolExecutor(max_workers=len(COMPRESSION_FUNCTIONS), thread_name_prefix='compression')
+
+# Compression headers dominate for smaller data
+MIN_COMPRESSIBLE_SIZE = 512
+
+ZSTD_DICTIONARY_SIZE = 64 * 1024
+
+DIRECTORY_LISTING_CACHE_SIZE = 1024
+# Directory modification time has coarse granularity, so a listing taken within this period after the
+# modification could miss a later modification having the same modification time
+RACY_MODIFICATION_PERIOD_NS = 1_000_000_000
+
+FINALIZED_PATHS_CACHE_SIZE = 4096
+COMPRESSION_CHUNK_SIZE = 1024 * 1024
+ABSOLUTE_PATHS_CACHE_SIZE = 4096
+KNOWN_DIRECTORIES_CACHE_SIZE = 4096
+
+MADV_SEQUENTIAL = getattr(mmap, 'MADV_SEQUENTIAL', None)  # not available on some platforms
+
 STAT_WRITE_PERMS_ALL = stat.S_IWGRP | stat.S_IWUSR | stat.S_IWOTH
+# Files are written atomically via temporary files that `tempfile.mkstemp()` creates with this mode
+WRITTEN_FILE_MODE = 0o600
+FINALIZED_FILE_MODE = WRITTEN_FILE_MODE & ~STAT_WRITE_PERMS_ALL
+
+# Data sync is enough for newly written files: it also syncs metadata required to read the data (file size)
+sync_file_data = getattr(os, 'fdatasync', os.fsync)  # `os.fdatasync()` is not available on some platforms
 
 logger = logging.getLogger(__name__)
 
+# Directory path -> (directory modification time, entry names)
+directory_listing_cache = LRUCache(DIRECTORY_LISTING_CACHE_SIZE)
+
+
+def get_speed_tier_compressors(speed_tier: str) -> tuple[str, ...]:
+    if speed_tier == 'archival':
+        return tuple(compressor for compressor in ('xz', 'bz2', 'gz') if compressor in COMPRESSION_FUNCTIONS)
+
+    try:
+        preferred_compressors = SPEED_TIER_COMPRESSORS[speed_tier]
+    except KeyError:
+        raise ValueError(f'Unknown speed tier: {speed_tier}')
+
+    return next((compressor,) for compressor in preferred_compressors if compressor in COMPRESSION_FUNCTIONS)
+
+
+def train_zstd_dictionary(samples: list[bytes], dict_size=ZSTD_DICTIONARY_SIZE) -> bytes:
+    """Return zstd dictionary trained on `samples` (to be used as `FileSystemStorage` `zstd_dictionary_path`)"""
+    if not zstandard:
+        raise ValueError('zstandard package is required to train zstd dictionary')
 
-def ensure_directory_exists_for_file_path(file_path):
-    directory = os.path.dirname(file_path)
-    if directory:
-        os.makedirs(directory, exist_ok=True)
+    return zstandard.train_dictionary(dict_size, samples).as_bytes()
 
 
 def drop_write_permissions(filename):
@@ -47,19 +226,99 @@ def has_write_permissions(filename):
 
 
 def strip_compression_extension(filename):
-    for compressor in DECOMPRESSION_FUNCTIONS:
-        if filename.endswith('.' + compressor):
-            return filename[:-len(compressor) - 1]
+    # A single set lookup of the last extension does not depend on the number of supported compressions
+    stem, dot, extension = filename.rpartition('.')
+    return stem if dot and extension in COMPRESSION_EXTENSIONS else filename
 
-    return filename
 
+def get_directory_listing(directory: str) -> frozenset[str]:
+    """Return names of `directory` entries. The listing is cached until the directory is modified (possibly by
+    another process), so probing for files with different compression extensions does not cost a syscall each.
+    """
+    try:
+        modification_time_ns = os.stat(directory).st_mtime_ns
+    except FileNotFoundError:
+        return frozenset()
+
+    cached = directory_listing_cache.get(directory)
+    if cached and cached[0] == modification_time_ns:
+        return cached[1]
+
+    listing_time_ns = time.time_ns()
+    try:
+        with os.scandir(directory) as entries:
+            names = frozenset(entry.name for entry in entries)
+    except FileNotFoundError:
+        return frozenset()
+
+    if listing_time_ns - modification_time_ns > RACY_MODIFICATION_PERIOD_NS:
+        directory_listing_cache[directory] = (modification_time_ns, names)
+
+    return names
+
+
+def get_compressed_file_paths(file_path: str):
+    directory, filename = os.path.split(file_path)
+    listing = get_directory_listing(directory)
+    for compressor in KNOWN_COMPRESSION_EXTENSIONS:
+        compressed_filename = filename + '.' + compressor
+        if compressed_filename in listing:
+            yield compressor, os.path.join(directory, compressed_filename)
+
+
+def get_decompression_function(functions, decompressor: str, path: str):
+    try:
+        return functions[decompressor]
+    except KeyError:
+        raise exceptions.StorageError(
+            f'Could not decompress {path}: {decompressor} decompression is not available '
+            '(optional package is not installed)'
+        )
 
-def exist_compressed_file(file_path):
-    for decompressor in DECOMPRESSION_FUNCTIONS:
-        path = file_path + '.' + decompressor
-        if os.path.exists(path):
-            return True
-    return False
+
+def compress_to_file(open_writer, data, file_path: str) -> int:
+    """Compress `data` to the file chunk by chunk and return compressed size"""
+    data = memoryview(data)
+    with open(file_path, 'wb') as fo:
+        with open_writer(fo) as writer:
+            for offset in range(0, len(data), COMPRESSION_CHUNK_SIZE):
+                writer.write(data[offset:offset + COMPRESSION_CHUNK_SIZE])
+
+        return fo.tell()
+
+
+def commit_temp_file(temp_file_path: str, file_path: Path, mode=None):
+    """Atomically move durably written temporary file to `file_path` (optionally setting its `mode` first)"""
+    # Sync and mode change are done on the same file descriptor, so the file is looked up by path only once
+    fd = os.open(temp_file_path, os.O_RDONLY)
+    try:
+        sync_file_data(fd)
+        if mode is not None:
+            os.fchmod(fd, mode)
+    finally:
+        os.close(fd)
+
+    replace_atomic(temp_file_path, str(file_path))
+
+
+@contextmanager
+def map_file(file_path):
+    """Yield read-only memory view of the file, so its data is not copied to memory at once"""
+    with open(file_path, 'rb') as fo:
+        if not os.fstat(fo.fileno()).st_size:
+            yield memoryview(b'')  # empty files cannot be memory-mapped
+            return
+
+        with mmap.mmap(fo.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            if MADV_SEQUENTIAL is not None:
+                # Mapped data is (de)compressed from start to end, so let the kernel read ahead aggressively
+                mapped.madvise(MADV_SEQUENTIAL)
+
+            yield view
+
+
+def get_framed_file_path(file_path: Path) -> Path:
+    return Path(f'{file_path}.{FRAMED_COMPRESSOR}')
 
 
 class FileSystemStorage:
@@ -67,13 +326,76 @@ class FileSystemStorage:
     Compressing / decompressing storage for capacity optimization
     """
 
-    def __init__(self, base_path: Union[str, Path], compressors=tuple(COMPRESSION_FUNCTIONS), temp_dir='.tmp'):
-        self.base_path = Path(base_path).resolve()
-        self.compressors = compressors
+    def __init__(
+        self,
+        base_path: Union[str, Path],
+        compressors=DEFAULT_COMPRESSORS,
+        temp_dir='.tmp',
+        speed_tier: Optional[str] = None,
+        zstd_dictionary_path: Optional[Union[str, Path]] = None,
+        framed_append=False,
+    ):
+        """
+        Args:
+            compressors: compressors to choose the best (the smallest result) from on finalization
+            speed_tier: 'fast', 'balanced' or 'archival' (overrides `compressors` if set)
+            zstd_dictionary_path: path to zstd dictionary (see `train_zstd_dictionary()`) to compress and
+                decompress zstd files with. Files compressed with a dictionary cannot be read without it
+            framed_append: compress appended data frame by frame with zstd, so finalization does not recompress
+                the whole file (requires zstandard package)
+        """
+        # Absolute path is only normalized to avoid `resolve()` syscalls (symlinks are not followed anyway)
+        self.base_path = Path(os.path.normpath(base_path)) if os.path.isabs(base_path) else Path(base_path).resolve()
+        self._base_path_str = str(self.base_path)
+        self._base_path_prefix = os.path.join(self._base_path_str, '')
+        self.compressors = compressors if speed_tier is None else get_speed_tier_compressors(speed_tier)
+        unavailable_compressors = [
+            compressor for compressor in self.compressors if compressor not in COMPRESSION_FUNCTIONS
+        ]
+        if unavailable_compressors:
+            raise ValueError(
+                f'Compressors are not available (optional packages are not installed): {unavailable_compressors}'
+            )
+
         self.temp_dir = self.base_path / temp_dir
+        if framed_append and FRAMED_COMPRESSOR not in COMPRESSION_FUNCTIONS:
+            raise ValueError('zstandard package is required to use framed append')
+
+        self.is_framed_append = framed_append
+
+        self.compression_writer_functions = COMPRESSION_WRITER_FUNCTIONS
+        self.decompression_functions = DECOMPRESSION_FUNCTIONS
+        self.decompression_open_functions = DECOMPRESSION_OPEN_FUNCTIONS
+        self.zstd_dictionary = None
+        if zstd_dictionary_path is not None:
+            if not zstandard:
+                raise ValueError('zstandard package is required to use zstd dictionary')
+
+            # Dictionary primes compression with structures repeated across files (field names, etc)
+            self.zstd_dictionary = zstd_dictionary = zstandard.ZstdCompressionDict(
+                Path(zstd_dictionary_path).read_bytes()
+            )
+            self.compression_writer_functions = {
+                **COMPRESSION_WRITER_FUNCTIONS, 'zst': partial(open_zstd_writer, dict_data=zstd_dictionary)
+            }
+            self.decompression_functions = {
+                **DECOMPRESSION_FUNCTIONS, 'zst': partial(decompress_zstd, dict_data=zstd_dictionary)
+            }
+            self.decompression_open_functions = {
+                **DECOMPRESSION_OPEN_FUNCTIONS, 'zst': partial(open_zstd, dict_data=zstd_dictionary)
+            }
+
+        self._finalized_paths_cache = LRUCache(FINALIZED_PATHS_CACHE_SIZE)
+        # Base path never changes, so we can reuse absolute paths (block chunk file names repeat a lot)
+        self._absolute_paths_cache = LRUCache(ABSOLUTE_PATHS_CACHE_SIZE)
+        # Directories that we know exist, so we do not have to call `os.makedirs()` for them again. Directories
+        # are removed only by `clear()`
+        self._known_directories = LRUCache(KNOWN_DIRECTORIES_CACHE_SIZE)
 
     def clear(self):
         shutil.rmtree(self.base_path, ignore_errors=True)
+        self._finalized_paths_cache.clear()
+        self._known_directories.clear()
 
     @timeit_method()
     def save(self, file_path: Union[str, Path], binary_data: bytes, is_final=False):
@@ -81,19 +403,43 @@ class FileSystemStorage:
 
     def load(self, file_path: Union[str, Path]) -> bytes:
         file_path = self._get_absolute_path(file_path)
-        for decompressor, func in DECOMPRESSION_FUNCTIONS.items():
-            path = str(file_path) + '.' + decompressor
-            try:
-                with open(path, mode='rb') as fo:
-                    data = fo.read()
-            except OSError:
-                continue
+        for decompressor, path in get_compressed_file_paths(str(file_path)):
+            with ExitStack() as stack:
+                try:
+                    data = stack.enter_context(map_file(path))
+                except OSError:
+                    continue
 
-            return func(data)  # type: ignore
+                decompress = get_decompression_function(self.decompression_functions, decompressor, path)
+                return decompress(data)
 
         with open(file_path, mode='rb') as fo:
             return fo.read()
 
+    def exists(self, file_path: Union[str, Path]) -> bool:
+        """Return `True` if the file exists (compressed or not)"""
+        file_path = self._get_absolute_path(file_path)
+        return os.path.exists(file_path) or any(get_compressed_file_paths(str(file_path)))
+
+    def has_file_with_prefix(self, file_path_prefix: Union[str, Path]) -> bool:
+        """Return `True` if a file (compressed or not) which path starts with `file_path_prefix` exists. It is
+        a single lookup in the cached directory listing, unlike probing several file paths with `exists()`
+        """
+        directory, filename_prefix = os.path.split(self._get_absolute_path(file_path_prefix))
+        return any(name.startswith(filename_prefix) for name in get_directory_listing(directory))
+
+    def open_stream(self, file_path: Union[str, Path]) -> BinaryIO:
+        """Return binary file object to read (decompressed on the fly) data without loading it to memory at once"""
+        file_path = self._get_absolute_path(file_path)
+        for decompressor, path in get_compressed_file_paths(str(file_path)):
+            open_function = get_decompression_function(self.decompression_open_functions, decompressor, path)
+            try:
+                return open_function(path, mode='rb')
+            except OSError:
+                continue
+
+        return open(file_path, mode='rb')
+
     def append(self, file_path: Union[str, Path], binary_data: bytes, is_final=False):
         self._persist(file_path, binary_data, 'ab', is_final=is_final)
 
@@ -109,88 +455,217 @@ class FileSystemStorage:
     def move(self, source: Union[str, Path], destination: Union[str, Path]):
         source = self._get_absolute_path(source)
         destination = self._get_absolute_path(destination)
-        ensure_directory_exists_for_file_path(destination)
-        os.rename(source, destination)
+        self._ensure_directory_exists_for_file_path(destination)
+        self._finalized_paths_cache.pop(source, None)
+        self._finalized_paths_cache.pop(destination, None)
+        if self.is_framed_append and not os.path.exists(source):
+            framed_source = get_framed_file_path(source)
+            if os.path.exists(framed_source):
+                os.replace(framed_source, get_framed_file_path(destination))
+                return
+
+        os.replace(source, destination)
 
     def is_finalized(self, file_path: Union[str, Path]):
         file_path = self._get_absolute_path(file_path)
         return self._is_finalized(file_path)
 
-    def _get_absolute_path(self, file_path: Union[str, Path]) -> Path:
-        base_path = self.base_path
-        path = Path(file_path)
-        abs_path = (base_path / path).resolve()
+    def _ensure_directory_exists(self, directory: Union[str, Path]):
+        known_directories = self._known_directories
+        if not known_directories.get(directory):
+            os.makedirs(directory, exist_ok=True)
+            known_directories[directory] = True
 
-        if path.is_absolute():
-            raise ValueError(f"Cannot use absolute path: '{path}'")
+    def _ensure_directory_exists_for_file_path(self, file_path: Union[str, Path]):
+        directory = os.path.dirname(file_path)
+        if directory:
+            self._ensure_directory_exists(directory)
 
-        if not abs_path.is_relative_to(base_path):
-            raise ValueError(f"Path '{abs_path}' is not relative to '{base_path}'")
+    def _get_absolute_path(self, file_path: Union[str, Path]) -> Path:
+        absolute_paths_cache = self._absolute_paths_cache
+        abs_path = absolute_paths_cache.get(file_path)
+        if abs_path is None:
+            absolute_paths_cache[file_path] = abs_path = self._make_absolute_path(file_path)
 
         return abs_path
 
-    @timeit_method()
+    def _make_absolute_path(self, file_path: Union[str, Path]) -> Path:
+        # We intentionally use string operations instead of `Path.resolve()` to avoid syscalls (symlinks are not
+        # followed, base path is resolved once on initialization)
+        if os.path.isabs(file_path):
+            raise ValueError(f"Cannot use absolute path: '{file_path}'")
+
+        base_path_str = self._base_path_str
+        abs_path_str = os.path.normpath(os.path.join(base_path_str, file_path))
+        if abs_path_str != base_path_str and not abs_path_str.startswith(self._base_path_prefix):
+            raise ValueError(f"Path '{abs_path_str}' is not relative to '{base_path_str}'")
+
+        return Path(abs_path_str)
+
     def _compress(self, file_path: Path) -> Path:
-        compressors = self.compressors
-        if not compressors:
+        """Return path to the compressed file (it is committed read-only) or `file_path` if the file was not
+        compressed.
+        """
+        if not self.compressors:
             return file_path
 
-        with open(file_path, 'rb') as fo:
-            original_data = fo.read()
-
-        logger.debug('File %s size: %s bytes', file_path, len(original_data))
-        best_filename = file_path
-        best_data = original_data
+        with map_file(file_path) as original_data:
+            best_filename, temp_file_path = self._compress_to_temp_file(file_path, original_data)
 
-        for compressor in self.compressors:
-            compress_function = COMPRESSION_FUNCTIONS[compressor]
-            compressed_data = compress_function(original_data)  # type: ignore
-            compressed_size = len(compressed_data)
-            logger.debug(
-                'File %s compressed with %s size: %s bytes (%.2f ratio)', file_path, compressor, compressed_size,
-                compressed_size / len(original_data)
-            )
-            # TODO(dmu) LOW: For compressed_size == best[0] choose fastest compression
-            if compressed_size < len(best_data):
-                best_filename = Path(str(file_path) + '.' + compressor)
-                best_data = compressed_data
-                logger.debug('New best %s: %s size', best_filename, len(best_data))
+        if temp_file_path is None:
+            return file_path
 
-        if best_filename != file_path:
-            logger.debug('Writing compressed file: %s (%s bytes)', best_filename, len(best_data))
-            self._write_file(best_filename, best_data, mode='wb')
+        logger.debug('Writing compressed file: %s', best_filename)
+        commit_temp_file(temp_file_path, best_filename, mode=FINALIZED_FILE_MODE)
 
-            logger.debug('Removing %s', file_path)
-            os.remove(file_path)
+        logger.debug('Removing %s', file_path)
+        os.remove(file_path)
 
         return best_filename
 
+    @timeit_method()
+    def _compress_to_temp_file(self, file_path: Path, original_data) -> tuple[Path, Optional[str]]:
+        """Return (file path, temporary file path) pair for the best compression of `original_data`. Temporary file
+        path is `None` if compression does not make data smaller (so `file_path` itself is returned).
+        Compressed data is streamed to temporary files, so we do not keep it in memory.
+        """
+        original_size = len(original_data)
+        logger.debug('File %s size: %s bytes', file_path, original_size)
+
+        compressors = self.compressors
+        if not compressors:
+            return file_path, None
+
+        if original_size < MIN_COMPRESSIBLE_SIZE:
+            logger.debug('File %s is too small to compress, skipping compression', file_path)
+            return file_path, None
+
+        self._ensure_directory_exists(self.temp_dir)
+        temp_file_paths = []
+        best_temp_file_path = None
+        try:
+            for compressor in compressors:
+                fd, temp_file_path = tempfile.mkstemp(suffix='.' + compressor, dir=self.temp_dir)
+                os.close(fd)
+                temp_file_paths.append(temp_file_path)
+
+            writer_functions = self.compression_writer_functions
+            if len(compressors) > 1:
+                futures = [
+                    compression_executor.submit(
+                        compress_to_file, writer_functions[compressor], original_data, temp_file_path
+                    ) for compressor, temp_file_path in zip(compressors, temp_file_paths)
+                ]
+                # Temporary files are removed on error, so we let all compressions finish writing them first
+                wait(futures)
+                compressed_sizes = [future.result() for future in futures]
+            else:
+                compressed_sizes = [
+                    compress_to_file(writer_functions[compressors[0]], original_data, temp_file_paths[0])
+                ]
+
+            best_filename = file_path
+            best_size = original_size
+            # We iterate in `compressors` order, so the first of equally good compressors wins
+            for compressor, temp_file_path, compressed_size in zip(compressors, temp_file_paths, compressed_sizes):
+                logger.debug(
+                    'File %s compressed with %s size: %s bytes (%.2f ratio)', file_path, compressor, compressed_size,
+                    compressed_size / original_size
+                )
+                # TODO(dmu) LOW: For compressed_size == best[0] choose fastest compression
+                if compressed_size < best_size:
+                    best_filename = Path(str(file_path) + '.' + compressor)
+                    best_size = compressed_size
+                    best_temp_file_path = temp_file_path
+                    logger.debug('New best %s: %s size', best_filename, best_size)
+        finally:
+            for temp_file_path in temp_file_paths:
+                if temp_file_path != best_temp_file_path:
+                    remove_quite(temp_file_path)
+
+        return best_filename, best_temp_file_path
+
     def _persist(self, file_path: Union[str, Path], binary_data: bytes, mode, is_final=False):
         file_path = self._get_absolute_path(file_path)
-        ensure_directory_exists_for_file_path(str(file_path))
+        self._ensure_directory_exists_for_file_path(file_path)
+
+        if is_final and mode == 'wb':
+            # Compress data in memory, so we do not need to write it uncompressed and reread it from filesystem
+            self._finalize_data(file_path, binary_data)
+            return
+
+        # Data appended uncompressed earlier (before framed appends were enabled) is appended the old way
+        if mode == 'ab' and self.is_framed_append and not os.path.exists(file_path):
+            self._append_frame(file_path, binary_data)
+            if is_final:
+                self._finalize(file_path)
+            return
 
-        # TODO(dmu) HIGH: Optimize for 'wb' mode so we do not need to reread the file from
-        #                 filesystem to compress it
         self._write_file(file_path, binary_data, mode)
 
         if is_final:
             self._finalize(file_path)
 
+    def _finalize_data(self, file_path: Path, binary_data: bytes):
+        if self._is_finalized(file_path):
+            raise exceptions.FinalizedFileWriteError(f'Could not write to finalized file: {file_path}')
+
+        best_filename, temp_file_path = self._compress_to_temp_file(file_path, binary_data)
+        logger.debug('Writing finalized file: %s', best_filename)
+        if temp_file_path is None:
+            self._write_file(file_path, binary_data, mode='wb', check_finalized=False, file_mode=FINALIZED_FILE_MODE)
+        else:
+            commit_temp_file(temp_file_path, best_filename, mode=FINALIZED_FILE_MODE)
+            if os.path.exists(file_path):
+                # Remove non-finalized version of the file written earlier
+                logger.debug('Removing %s', file_path)
+                os.remove(file_path)
+
+    def _append_frame(self, file_path: Path, binary_data: bytes):
+        if self._is_finalized(file_path):
+            raise exceptions.FinalizedFileWriteError(f'Could not write to finalized file: {file_path}')
+
+        compressor = zstandard.ZstdCompressor(level=FRAMED_COMPRESSION_LEVEL, dict_data=self.zstd_dictionary)
+        compressed_data = compressor.compress(binary_data)
+        self._write_file(get_framed_file_path(file_path), compressed_data, 'ab', check_finalized=False)
+
     def _finalize(self, file_path: Path):
-        new_filename = self._compress(file_path)
-        drop_write_permissions(new_filename)
+        if self.is_framed_append and not os.path.exists(file_path):
+            framed_file_path = get_framed_file_path(file_path)
+            if os.path.exists(framed_file_path):
+                # Framed file is already compressed
+                drop_write_permissions(framed_file_path)
+                return
+
+        if self._compress(file_path) == file_path:
+            drop_write_permissions(file_path)
+
+    def _is_finalized(self, file_path: Path):
+        # Finalized files never change, so we cache only positive results (a file that is not finalized may get
+        # finalized by another process)
+        finalized_paths_cache = self._finalized_paths_cache
+        if finalized_paths_cache.get(file_path):
+            return True
+
+        is_finalized = self._probe_is_finalized(file_path)
+        if is_finalized:
+            finalized_paths_cache[file_path] = True
+
+        return is_finalized
 
     @staticmethod
-    def _is_finalized(file_path: Path):
-        return (
-            exist_compressed_file(str(file_path)) or
-            (os.path.exists(file_path) and not has_write_permissions(file_path))
-        )
+    def _probe_is_finalized(file_path: Path):
+        for compressor, path in get_compressed_file_paths(str(file_path)):
+            # Framed file is appended to until it is finalized by dropping write permissions
+            if compressor != FRAMED_COMPRESSOR or not has_write_permissions(path):
+                return True
 
-    def _write_file(self, file_path: Path, binary_data: bytes, mode):
-        if self._is_finalized(file_path):
+        return os.path.exists(file_path) and not has_write_permissions(file_path)
+
+    def _write_file(self, file_path: Path, binary_data: bytes, mode, check_finalized=True, file_mode=None):
+        if check_finalized and self._is_finalized(file_path):
             raise exceptions.FinalizedFileWriteError(f'Could not write to finalized file: {file_path}')
 
-        self.temp_dir.mkdir(parents=True, exist_ok=True)
-        with atomic_write_append(file_path, mode=mode, dir=self.temp_dir) as fo:
+        self._ensure_directory_exists(self.temp_dir)
+        with atomic_write_append(file_path, mode=mode, file_mode=file_mode, dir=self.temp_dir) as fo:
             fo.write(binary_data)
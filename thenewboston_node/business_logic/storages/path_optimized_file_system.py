@@ -1,6 +1,7 @@
 import logging
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Union
 
@@ -11,8 +12,11 @@ logger = logging.getLogger(__name__)
 REMOVE_RE = re.compile(r'[^0-9a-z]')
 
 DEFAULT_MAX_DEPTH = 8
+OPTIMIZED_PATHS_CACHE_SIZE = 65536
 
 
+# The same paths are optimized over and over again (save, finalize, load, etc)
+@lru_cache(maxsize=OPTIMIZED_PATHS_CACHE_SIZE)
 def make_optimized_file_path(path, max_depth):
     directory, filename = os.path.split(path)
     normalized_filename = REMOVE_RE.sub('', filename.rsplit('.', 1)[0].lower())
@@ -20,6 +24,35 @@ def make_optimized_file_path(path, max_depth):
     return os.path.join(directory, extra_path, filename)
 
 
+def walk_files(directory_path):
+    """Yield (directory path, file names) pairs for `directory_path` and its subdirectories (symlinks to
+    directories are not followed). Unlike `os.walk()` it uses directory entry types and does not `lstat()`
+    every subdirectory
+    """
+    directory_paths = [directory_path]
+    while directory_paths:
+        dir_path = directory_paths.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            continue
+
+        filenames = []
+        with entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if not is_dir:
+                    filenames.append(entry.name)
+                elif not entry.is_symlink():
+                    directory_paths.append(entry.path)
+
+        yield dir_path, filenames
+
+
 class PathOptimizedFileSystemStorage(FileSystemStorage):
     """
     Storage decorator transparently placing file to
@@ -36,6 +69,20 @@ class PathOptimizedFileSystemStorage(FileSystemStorage):
     def load(self, file_path) -> bytes:
         return super().load(self._get_optimized_path(file_path))
 
+    def exists(self, file_path):
+        return super().exists(self._get_optimized_path(file_path))
+
+    def has_file_with_prefix(self, file_path_prefix):
+        # Optimized path depends on the first characters of the file name, so they must be known
+        filename_prefix = os.path.basename(file_path_prefix)
+        if len(REMOVE_RE.sub('', filename_prefix.split('.', 1)[0].lower())) < self.max_depth:
+            raise ValueError(f'File name prefix is too short to get optimized path: {filename_prefix}')
+
+        return super().has_file_with_prefix(self._get_optimized_path(file_path_prefix))
+
+    def open_stream(self, file_path):
+        return super().open_stream(self._get_optimized_path(file_path))
+
     def append(self, file_path, binary_data: bytes, is_final=False):
         return super().append(self._get_optimized_path(file_path), binary_data, is_final=is_final)
 
@@ -61,8 +108,10 @@ class PathOptimizedFileSystemStorage(FileSystemStorage):
         super().move(self._get_optimized_path(source), optimized_destination)
 
     def _list_directory_generator(self, directory_path):
-        directory_path = self._get_absolute_path(directory_path)
-        for dir_path, _, filenames in os.walk(directory_path):
+        directory_path = str(self._get_absolute_path(directory_path))
+        # Listed paths are relative to base path, so we can avoid `os.path.relpath()` for every file
+        relative_prefix = os.path.join(directory_path[len(self._base_path_prefix):], '')
+        for dir_path, filenames in walk_files(directory_path):
             original_filenames = map(strip_compression_extension, filenames)
             unique_filenames = set(original_filenames)  # remove duplicated files after strip
 
@@ -71,15 +120,13 @@ class PathOptimizedFileSystemStorage(FileSystemStorage):
                 logger.warning(f'Duplicated files found: {duplicates}')
 
             for filename in unique_filenames:
-                file_path = os.path.join(dir_path, filename)
-
-                path = os.path.join(directory_path, filename)
-                expected_optimized_path = self._get_optimized_path(path)
+                file_path = f'{dir_path}/{filename}'
+                expected_optimized_path = self._get_optimized_path(f'{directory_path}/{filename}')
                 if file_path != expected_optimized_path:
                     logger.warning('Expected %s optimized path, but got %s', expected_optimized_path, file_path)
                     continue
 
-                yield os.path.relpath(path, self.base_path)
+                yield relative_prefix + filename
 
     def _get_optimized_path(self, file_path):
         return make_optimized_file_path(file_path, self.max_depth)
@@ -3,7 +3,7 @@ import pytest
 from thenewboston_node.business_logic.models import CoinTransferSignedChangeRequestMessage, CoinTransferTransaction
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_coin_transfer_signed_request_message(
     treasury_account_key_pair, user_account_key_pair, node_key_pair, primary_validator_key_pair
 ):
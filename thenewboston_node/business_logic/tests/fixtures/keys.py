@@ -4,7 +4,7 @@ from thenewboston_node.core.utils.cryptography import KeyPair
 from thenewboston_node.core.utils.types import hexstr
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def user_account_key_pair() -> KeyPair:
     return KeyPair(
         public=hexstr('97b369953f665956d47b0a003c268ad2b05cf601b8798210ca7c2423afb9af78'),
@@ -12,7 +12,7 @@ def user_account_key_pair() -> KeyPair:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def node_key_pair() -> KeyPair:
     return KeyPair(
         public=hexstr('1c8e5f54a15b63a9f3d540ce505fd0799575ffeaac62ce625c917e6d915ea8bb'),
@@ -20,7 +20,7 @@ def node_key_pair() -> KeyPair:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def primary_validator_key_pair() -> KeyPair:
     return KeyPair(
         public=hexstr('b9dc49411424cce606d27eeaa8d74cb84826d8a1001d17603638b73bdc6077f1'),
@@ -28,7 +28,7 @@ def primary_validator_key_pair() -> KeyPair:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def treasury_account_key_pair() -> KeyPair:
     return KeyPair(
         public=hexstr('4d3cf1d9e4547d324de2084b568f807ef12045075a7a01b8bec1e7f013fc3732'),
@@ -36,26 +36,26 @@ def treasury_account_key_pair() -> KeyPair:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def user_account(user_account_key_pair):
     return user_account_key_pair.public
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def primary_validator_identifier(primary_validator_key_pair):
     return primary_validator_key_pair.public
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def node_identifier(node_key_pair):
     return node_key_pair.public
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def treasury_account(treasury_account_key_pair):
     return treasury_account_key_pair.public
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def treasury_account_signing_key(treasury_account_key_pair):
     return treasury_account_key_pair.private
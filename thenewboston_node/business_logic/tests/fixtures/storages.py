@@ -1,6 +1,5 @@
 import glob
 import os
-import shutil
 import stat
 from itertools import chain
 from pathlib import Path
@@ -9,6 +8,9 @@ import pytest
 
 from thenewboston_node.core.utils.os import chmod_quite, remove_quite
 
+# Prefer RAM disk (if available) to avoid disk I/O in tests
+TESTING_DIRECTORY_BASE = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else '/tmp'
+
 
 @pytest.fixture
 def base_filename():
@@ -27,20 +29,23 @@ def base_file_path(blockchain_path, base_filename):
 
 @pytest.fixture
 def blockchain_directory():
-    directory = f'/tmp/for-thenewboston-blockchain-testing-{os.getpid()}'
+    directory = f'{TESTING_DIRECTORY_BASE}/for-thenewboston-blockchain-testing-{os.getpid()}'
     try:
         os.makedirs(directory, exist_ok=True)
         yield directory
     finally:
-        for dir_path, dir_names, filenames in os.walk(directory):
-            for dir_name in dir_names:
-                chmod_quite(os.path.join(dir_path, dir_name), 0o777)
-
+        # Remove the directory in a single bottom-up pass (removing read-only finalized files does not require
+        # changing their permissions, since it is a directory modification)
+        for dir_path, dir_names, filenames in os.walk(directory, topdown=False):
             for filename in filenames:
-                chmod_quite(os.path.join(dir_path, filename), 0o666)
+                os.remove(os.path.join(dir_path, filename))
+
+            for dir_name in dir_names:
+                path = os.path.join(dir_path, dir_name)
+                if os.path.islink(path):
+                    os.remove(path)
 
-        if os.path.isdir(directory):
-            shutil.rmtree(directory)
+            os.rmdir(dir_path)
 
 
 @pytest.fixture
@@ -1,3 +1,6 @@
+import io
+
+
 class StorageMock:
 
     def __init__(self):
@@ -12,6 +15,15 @@ class StorageMock:
     def load(self, file_path) -> bytes:
         return self.files[file_path]
 
+    def exists(self, file_path):
+        return file_path in self.files
+
+    def has_file_with_prefix(self, file_path_prefix):
+        return any(file_path.startswith(file_path_prefix) for file_path in self.files)
+
+    def open_stream(self, file_path):
+        return io.BytesIO(self.files[file_path])
+
     def append(self, file_path, binary_data: bytes, is_final=False):
         self.files.setdefault(file_path, b'')
         self.files[file_path] += binary_data
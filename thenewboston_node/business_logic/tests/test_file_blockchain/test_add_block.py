@@ -171,3 +171,115 @@ def test_can_add_block(
                                                   ) == (treasury_initial_balance - 30 - 10 + 5 - 2 * total_fees)
     assert blockchain.get_account_current_balance(node_account) == 1 * 3
     assert blockchain.get_account_current_balance(pv_account) == 4 * 3
+
+
+def test_block_count_is_maintained_incrementally(
+    file_blockchain_w_memory_storage, user_account, treasury_account_signing_key
+):
+    blockchain = file_blockchain_w_memory_storage
+    assert blockchain.get_block_count() == 0
+
+    node_signing_key = get_node_signing_key()
+    with patch.object(blockchain, '_count_blocks', wraps=blockchain._count_blocks) as count_blocks_mock:
+        for amount in (10, 20, 30):
+            block = Block.create_from_main_transaction(
+                blockchain=blockchain,
+                recipient=user_account,
+                amount=amount,
+                request_signing_key=treasury_account_signing_key,
+                pv_signing_key=node_signing_key,
+            )
+            blockchain.add_block(block)
+            assert blockchain.get_block_count() == block.message.block_number + 1
+
+        count_blocks_mock.assert_not_called()
+
+
+def test_block_count_is_recounted_on_unexpected_block_number(
+    file_blockchain_w_memory_storage, user_account, treasury_account_signing_key
+):
+    blockchain = file_blockchain_w_memory_storage
+    block = Block.create_from_main_transaction(
+        blockchain=blockchain,
+        recipient=user_account,
+        amount=10,
+        request_signing_key=treasury_account_signing_key,
+        pv_signing_key=get_node_signing_key(),
+    )
+    blockchain.add_block(block)
+    assert blockchain.get_block_count() == 1
+
+    # Simulate the block count being cached before another process added a block
+    blockchain._block_count = 1
+    blockchain._counted_last_block_number = -5
+    blockchain._update_block_count(1)
+    assert blockchain._block_count is None
+    assert blockchain.get_block_count() == 1
+
+
+def test_block_count_takes_into_account_blocks_added_by_another_process(
+    blockchain_directory, blockchain_genesis_state, user_account, treasury_account_signing_key, forced_mock_network,
+    get_primary_validator_mock, get_preferred_node_mock
+):
+    blockchain = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=2)
+    blockchain.add_blockchain_state(blockchain_genesis_state)
+    another_blockchain = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=2)
+    assert blockchain.get_block_count() == 0
+
+    node_signing_key = get_node_signing_key()
+    for expected_block_count in (1, 2, 3, 4, 5):
+        block = Block.create_from_main_transaction(
+            blockchain=another_blockchain,
+            recipient=user_account,
+            amount=10,
+            request_signing_key=treasury_account_signing_key,
+            pv_signing_key=node_signing_key,
+        )
+        another_blockchain.add_block(block)
+        assert blockchain.get_block_count() == expected_block_count
+
+
+def test_block_count_is_recounted_if_blocks_were_added_by_another_process_to_empty_blockchain(
+    blockchain_directory, blockchain_genesis_state, user_account, treasury_account_signing_key, forced_mock_network,
+    get_primary_validator_mock, get_preferred_node_mock
+):
+    blockchain = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=2)
+    blockchain.add_blockchain_state(blockchain_genesis_state)
+    another_blockchain = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=2)
+    assert blockchain.get_block_count() == 0
+
+    node_signing_key = get_node_signing_key()
+    for adding_blockchain in (another_blockchain, another_blockchain, another_blockchain, blockchain):
+        block = Block.create_from_main_transaction(
+            blockchain=adding_blockchain,
+            recipient=user_account,
+            amount=10,
+            request_signing_key=treasury_account_signing_key,
+            pv_signing_key=node_signing_key,
+        )
+        adding_blockchain.add_block(block)
+
+    assert blockchain.get_block_count() == 4
+
+
+def test_block_chunk_files_are_listed_once_per_added_block(
+    file_blockchain_w_memory_storage, user_account, treasury_account_signing_key
+):
+    blockchain = file_blockchain_w_memory_storage
+    node_signing_key = get_node_signing_key()
+    for amount in (10, 20, 30):
+        block = Block.create_from_main_transaction(
+            blockchain=blockchain,
+            recipient=user_account,
+            amount=amount,
+            request_signing_key=treasury_account_signing_key,
+            pv_signing_key=node_signing_key,
+        )
+        storage = blockchain.block_storage
+        with patch.object(storage, 'list_directory', wraps=storage.list_directory) as list_directory_mock:
+            blockchain.add_block(block)
+
+        assert list_directory_mock.call_count <= 1
+        assert blockchain._block_chunk_files is None
+
+    assert [block.message.block_number for block in blockchain.yield_blocks()] == [0, 1, 2]
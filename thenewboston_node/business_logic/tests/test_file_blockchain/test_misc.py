@@ -11,6 +11,7 @@ def test_get_block_chunk_filename_meta():
     assert get_block_chunk_filename_meta('00012-000101-block-chunk.msgpack.zip') is None
     assert get_block_chunk_filename_meta('00012-abc-block-chunk.msgpack') is None
     assert get_block_chunk_filename_meta('00012-000101-aaaaa.msgpack') is None
+    assert get_block_chunk_filename_meta('00012-000101-block-chunk.msgpack.gz.tmp') is None
 
 
 def test_get_blockchain_filename_meta():
@@ -22,3 +23,11 @@ def test_get_blockchain_filename_meta():
     assert get_blockchain_state_filename_meta('000aaaa-arf.msgpack') is None
     assert get_blockchain_state_filename_meta('0000012-aaa.msgpack') is None
     assert get_blockchain_state_filename_meta('0000012-arf.msgpack.zip') is None
+
+
+def test_block_chunk_filename_meta_is_cached_by_filename():
+    get_block_chunk_filename_meta.cache_clear()
+    meta = get_block_chunk_filename_meta('00012-000101-block-chunk.msgpack')
+    assert meta == (12, 101, None)
+    assert get_block_chunk_filename_meta('00012-000101-block-chunk.msgpack') is meta
+    assert get_block_chunk_filename_meta.cache_info().hits == 1
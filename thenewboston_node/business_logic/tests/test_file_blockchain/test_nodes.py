@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from thenewboston_node.business_logic.blockchain.file_blockchain import FileBlockchain
 from thenewboston_node.business_logic.models import AccountState, Block, Node, NodeDeclarationSignedChangeRequest
 from thenewboston_node.business_logic.node import get_node_signing_key
@@ -212,3 +214,93 @@ def test_can_get_nodes_from_complex_blockchain(blockchain_directory, blockchain_
     assert sort_me(blockchain.yield_nodes(block_number=1)) == sort_me([node3_old, node2, node1])
     assert sort_me(blockchain.yield_nodes(block_number=0)) == sort_me([node2, node1])
     assert sort_me(blockchain.yield_nodes(block_number=-1)) == sort_me([node1])
+
+    # Nodes are collected in a single pass instead of looking up every node account separately
+    with patch.object(blockchain, 'get_account_state_attribute_value') as get_account_state_attribute_value_mock:
+        assert sort_me(blockchain.yield_nodes(block_number=4)) == sort_me([node5, node3, node4, node2, node1])
+        assert sort_me(blockchain.yield_nodes()) == sort_me([node6, node5, node3, node4, node2, node1])
+
+    get_account_state_attribute_value_mock.assert_not_called()
+
+
+def test_has_nodes(blockchain_directory, blockchain_genesis_state, user_account_key_pair):
+    blockchain = FileBlockchain(base_directory=blockchain_directory)
+    blockchain.add_blockchain_state(blockchain_genesis_state)
+    assert not blockchain.has_nodes()
+
+    blockchain.clear()
+    account_number = user_account_key_pair.public
+    blockchain_genesis_state.account_states[account_number] = AccountState(
+        node=baker.make(Node, identifier=account_number)
+    )
+    blockchain.add_blockchain_state(blockchain_genesis_state)
+    assert blockchain.has_nodes()
+
+
+def test_has_nodes_declared_in_block(blockchain_directory, blockchain_genesis_state, user_account_key_pair):
+    blockchain = FileBlockchain(base_directory=blockchain_directory)
+    blockchain.add_blockchain_state(blockchain_genesis_state)
+    request = NodeDeclarationSignedChangeRequest.create(
+        network_addresses=['https://127.0.0.1:8555/'], fee_amount=3, signing_key=user_account_key_pair.private
+    )
+    blockchain.add_block(Block.create_from_signed_change_request(blockchain, request, get_node_signing_key()))
+
+    assert blockchain.has_nodes()
+    # Node accounts are not collected just to check if there are any nodes
+    assert blockchain._node_accounts is None
+
+
+def test_node_accounts_are_updated_incrementally(
+    blockchain_directory, blockchain_genesis_state, user_account_key_pair
+):
+    blockchain = FileBlockchain(base_directory=blockchain_directory)
+    key_pair = generate_key_pair()
+    blockchain_state_node = baker.make(Node, identifier=key_pair.public)
+    blockchain_genesis_state.account_states[key_pair.public] = AccountState(node=blockchain_state_node)
+    blockchain.add_blockchain_state(blockchain_genesis_state)
+    assert list(blockchain.get_node_accounts()) == [key_pair.public]
+
+    request = NodeDeclarationSignedChangeRequest.create(
+        network_addresses=['https://127.0.0.1:8555/'], fee_amount=3, signing_key=user_account_key_pair.private
+    )
+    blockchain.add_block(Block.create_from_signed_change_request(blockchain, request, get_node_signing_key()))
+    assert list(blockchain.get_node_accounts()) == [key_pair.public, user_account_key_pair.public]
+    assert list(blockchain.yield_nodes()) == [request.message.node, blockchain_state_node]
+
+    # A fresh instance populates node accounts from the stored blockchain
+    fresh_blockchain = FileBlockchain(base_directory=blockchain_directory)
+    assert list(fresh_blockchain.get_node_accounts()) == list(blockchain.get_node_accounts())
+
+    # Blocks added by another instance (process) are taken into account
+    another_key_pair = generate_key_pair()
+    request = NodeDeclarationSignedChangeRequest.create(
+        network_addresses=['https://127.0.0.1:8556/'], fee_amount=3, signing_key=another_key_pair.private
+    )
+    fresh_blockchain.add_block(
+        Block.create_from_signed_change_request(fresh_blockchain, request, get_node_signing_key())
+    )
+    expected_node_accounts = [key_pair.public, user_account_key_pair.public, another_key_pair.public]
+    assert list(blockchain.get_node_accounts()) == expected_node_accounts
+
+
+def test_nodes_declared_in_the_same_block_are_yielded_in_the_same_order_incrementally(
+    blockchain_directory, blockchain_genesis_state, user_account_key_pair
+):
+    blockchain = FileBlockchain(base_directory=blockchain_directory)
+    blockchain.add_blockchain_state(blockchain_genesis_state)
+    assert list(blockchain.get_node_accounts()) == []
+
+    request = NodeDeclarationSignedChangeRequest.create(
+        network_addresses=['https://127.0.0.1:8555/'], fee_amount=3, signing_key=user_account_key_pair.private
+    )
+    block = Block.create_from_signed_change_request(blockchain, request, get_node_signing_key())
+    for _ in range(2):
+        node = baker.make(Node, identifier=generate_key_pair().public)
+        block.message.updated_account_states[node.identifier] = AccountState(node=node)
+    blockchain.add_block(block, validate=False)
+
+    fresh_blockchain = FileBlockchain(base_directory=blockchain_directory)
+    expected_nodes = list(fresh_blockchain.yield_nodes())
+    assert len(expected_nodes) == 3
+    assert list(blockchain.yield_nodes()) == expected_nodes
+    assert list(blockchain.get_node_accounts()) == list(fresh_blockchain.get_node_accounts())
@@ -1,4 +1,11 @@
+from unittest.mock import patch
+
+import pytest
+
 from thenewboston_node.business_logic.blockchain.file_blockchain import FileBlockchain
+from thenewboston_node.business_logic.exceptions import InvalidBlockchain
+from thenewboston_node.business_logic.models.block import Block
+from thenewboston_node.business_logic.node import get_node_signing_key
 from thenewboston_node.business_logic.tests.factories import CoinTransferBlockFactory
 
 
@@ -14,3 +21,67 @@ def test_yield_blocks_from_cache(blockchain_directory):
     assert list(blockchain._yield_blocks_from_cache(1, 2, 1)) == [block1, block2]
     assert list(blockchain._yield_blocks_from_cache(0, 3, -1)) == [block3, block2, block1, block0]
     assert list(blockchain._yield_blocks_from_cache(1, 2, -1)) == [block2, block1]
+
+
+def test_yield_blocks_from_file_reuses_alive_blocks(
+    file_blockchain_w_memory_storage, user_account, treasury_account_signing_key
+):
+    blockchain = file_blockchain_w_memory_storage
+    filename = '0000-0001-block-chunk.msgpack'
+    for amount in (10, 20):
+        block = Block.create_from_main_transaction(
+            blockchain=blockchain,
+            recipient=user_account,
+            amount=amount,
+            request_signing_key=treasury_account_signing_key,
+            pv_signing_key=get_node_signing_key(),
+        )
+        blockchain.block_storage.append(filename, block.to_messagepack())
+
+    block0, block1 = blocks = list(blockchain._yield_blocks_from_file(filename, 1))
+    assert [block.message.block_number for block in blocks] == [0, 1]
+
+    blockchain.blocks_cache.clear()
+    with patch.object(Block, 'from_compact_dict') as from_compact_dict_mock:
+        assert list(blockchain._yield_blocks_from_file(filename, -1)) == [block1, block0]
+        assert list(blockchain._yield_blocks_from_file(filename, 1, start=1)) == [block1]
+
+    from_compact_dict_mock.assert_not_called()
+
+
+def test_yield_blocks_from_file_raises_on_unexpected_block_number(
+    file_blockchain_w_memory_storage, user_account, treasury_account_signing_key
+):
+    blockchain = file_blockchain_w_memory_storage
+    block = Block.create_from_main_transaction(
+        blockchain=blockchain,
+        recipient=user_account,
+        amount=10,
+        request_signing_key=treasury_account_signing_key,
+        pv_signing_key=get_node_signing_key(),
+    )
+    # Block 0 is stored in a chunk file that is named as containing block 5
+    filename = '0005-0005-block-chunk.msgpack'
+    blockchain.block_storage.append(filename, block.to_messagepack())
+
+    with pytest.raises(InvalidBlockchain, match='Block number 0 found at block number 5 position'):
+        list(blockchain._yield_blocks_from_file(filename, 1))
+
+
+def test_yield_blocks_from_file_reversed_raises_on_extra_blocks(
+    file_blockchain_w_memory_storage, user_account, treasury_account_signing_key
+):
+    blockchain = file_blockchain_w_memory_storage
+    block = Block.create_from_main_transaction(
+        blockchain=blockchain,
+        recipient=user_account,
+        amount=10,
+        request_signing_key=treasury_account_signing_key,
+        pv_signing_key=get_node_signing_key(),
+    )
+    # Two blocks are stored in a chunk file that is named as containing one block
+    filename = '0000-0000-block-chunk.msgpack'
+    blockchain.block_storage.append(filename, block.to_messagepack() * 2)
+
+    with pytest.raises(InvalidBlockchain, match='2 blocks found in 0000-0000-block-chunk.msgpack'):
+        list(blockchain._yield_blocks_from_file(filename, -1))
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from thenewboston_node.business_logic.blockchain.file_blockchain import FileBlockchain
 from thenewboston_node.business_logic.models import (
     AccountState, Block, Node, NodeDeclarationSignedChangeRequest, PrimaryValidatorSchedule,
@@ -132,3 +134,63 @@ def test_can_get_overridden_pv(blockchain_directory, blockchain_genesis_state, u
     assert blockchain.get_primary_validator(10) == node
     assert blockchain.get_primary_validator(99) == node
     assert blockchain.get_primary_validator(100) is None
+
+
+def test_primary_validator_is_cached(blockchain_directory, blockchain_genesis_state, user_account_key_pair):
+    blockchain = FileBlockchain(base_directory=blockchain_directory)
+
+    account_number = user_account_key_pair.public
+    node = baker.make(Node, identifier=account_number)
+    pv_schedule = baker.make(PrimaryValidatorSchedule, begin_block_number=0, end_block_number=99)
+    blockchain_genesis_state.account_states[account_number] = AccountState(
+        node=node, primary_validator_schedule=pv_schedule
+    )
+    blockchain.add_blockchain_state(blockchain_genesis_state)
+
+    with patch.object(blockchain, '_get_primary_validator', wraps=blockchain._get_primary_validator) as mock:
+        assert blockchain.get_primary_validator(10) == node
+        assert blockchain.get_primary_validator(10) == node
+        assert blockchain.get_primary_validator(100) is None
+        assert blockchain.get_primary_validator(100) is None
+
+    assert mock.call_count == 2
+
+    blockchain.clear()
+    blockchain_genesis_state.account_states[account_number].primary_validator_schedule = None
+    blockchain.add_blockchain_state(blockchain_genesis_state)
+    assert blockchain.get_primary_validator(10) is None
+
+
+def test_pv_schedules_are_updated_incrementally(blockchain_directory, blockchain_genesis_state, user_account_key_pair):
+    blockchain = FileBlockchain(base_directory=blockchain_directory)
+
+    account_number = user_account_key_pair.public
+    node = baker.make(Node, identifier=account_number)
+    pv_schedule = baker.make(PrimaryValidatorSchedule, begin_block_number=0, end_block_number=99)
+    blockchain_genesis_state.account_states[account_number] = AccountState(
+        node=node, primary_validator_schedule=pv_schedule
+    )
+    another_key_pair = generate_key_pair()
+    another_node = baker.make(Node, identifier=another_key_pair.public)
+    blockchain_genesis_state.account_states[another_key_pair.public] = AccountState(node=another_node)
+    blockchain.add_blockchain_state(blockchain_genesis_state)
+    assert blockchain.get_primary_validator_schedules(-1) == [(account_number, pv_schedule)]
+
+    request = PrimaryValidatorScheduleSignedChangeRequest.create(0, 99, another_key_pair.private)
+    block = Block.create_from_signed_change_request(blockchain, request, get_node_signing_key())
+    with patch.object(
+        blockchain, '_make_primary_validator_schedules', wraps=blockchain._make_primary_validator_schedules
+    ) as mock:
+        blockchain.add_block(block)
+        assert blockchain.get_primary_validator() == another_node
+
+    mock.assert_not_called()
+    expected_pv_schedules = [
+        (another_key_pair.public, request.message.primary_validator_schedule),
+        (account_number, pv_schedule),
+    ]
+    assert blockchain.get_primary_validator_schedules(0) == expected_pv_schedules
+
+    # A fresh instance builds primary validator schedules from the stored blockchain
+    assert FileBlockchain(base_directory=blockchain_directory
+                          ).get_primary_validator_schedules(0) == expected_pv_schedules
@@ -1,4 +1,5 @@
 import os.path
+from unittest.mock import patch
 
 import pytest
 
@@ -83,3 +84,28 @@ def test_blockchain_state_is_created_every_x_block(
     assert os.path.isfile(
         str(blockchain_path / f'blockchain-states/0/0/0/0/0/0/0/0/000000000{block.message.block_number}-arf.msgpack')
     )
+
+
+def test_blockchain_states_count_is_maintained_incrementally(
+    blockchain_directory, blockchain_genesis_state, blockchain_state_10, blockchain_state_20
+):
+    blockchain = FileBlockchain(base_directory=blockchain_directory)
+    assert blockchain.get_blockchain_states_count() == 0
+
+    blockchain.add_blockchain_state(blockchain_genesis_state)
+    with blockchain.file_lock:
+        assert blockchain.get_blockchain_states_count() == 1
+        with patch.object(blockchain, '_count_blockchain_states') as count_blockchain_states_mock:
+            blockchain.persist_blockchain_state(blockchain_state_10)
+            assert blockchain.get_blockchain_states_count() == 2
+
+        count_blockchain_states_mock.assert_not_called()
+
+    # Another instance (process) adds a blockchain state while we do not hold the lock
+    another_blockchain = FileBlockchain(base_directory=blockchain_directory)
+    with another_blockchain.file_lock:
+        another_blockchain.persist_blockchain_state(blockchain_state_20)
+    assert blockchain.get_blockchain_states_count() == 3
+
+    blockchain.clear()
+    assert blockchain.get_blockchain_states_count() == 0
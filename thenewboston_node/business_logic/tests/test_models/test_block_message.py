@@ -1,8 +1,10 @@
 import copy
+from unittest.mock import patch
 
 import pytest
 
 from thenewboston_node.business_logic.exceptions import ValidationError
+from thenewboston_node.core.utils.cryptography import generate_key_pair
 
 
 def test_validate_updated_account_states(memory_blockchain, block_message):
@@ -104,3 +106,46 @@ def test_validate_updated_account_states(memory_blockchain, block_message):
         ValidationError, match=r'Block message recipient account [0-9a-f]{64} balance must be equal to \d+'
     ):
         block_message_copy.validate_updated_account_states(memory_blockchain)
+
+
+def test_get_hash_is_cached(block_message):
+    with patch.object(block_message, 'get_normalized', wraps=block_message.get_normalized) as get_normalized_mock:
+        message_hash = block_message.get_hash()
+        assert block_message.get_hash() == message_hash
+        get_normalized_mock.assert_called_once()
+
+    block_message.block_number += 1
+    assert block_message.get_hash() != message_hash
+
+    message_hash = block_message.get_hash()
+    block_message.updated_account_states = dict([block_message.updated_account_states.popitem()])
+    assert block_message.get_hash() != message_hash
+
+    with patch.object(block_message, 'get_normalized', wraps=block_message.get_normalized) as get_normalized_mock:
+        block_message.get_hash()
+        block_message.invalidate_hash_cache()
+        block_message.get_hash()
+        assert get_normalized_mock.call_count == 2
+
+
+def test_cached_hash_is_not_copied(block_message):
+    signing_key = generate_key_pair().private
+    message_hash = block_message.get_hash()
+    signature = block_message.generate_signature(signing_key)
+
+    block_message_copy = copy.deepcopy(block_message)
+    block_message_copy.updated_account_states.popitem()
+    assert block_message_copy.get_hash() != message_hash
+    assert block_message_copy.generate_signature(signing_key) != signature
+    assert block_message.get_hash() == message_hash
+
+
+def test_get_normalized_is_shared_by_hash_and_signature(block_message):
+    signing_key = generate_key_pair().private
+    with patch.object(block_message, 'serialize_to_dict', wraps=block_message.serialize_to_dict) as serialize_mock:
+        block_message.get_hash()
+        signature = block_message.generate_signature(signing_key)
+        serialize_mock.assert_called_once()
+
+    block_message.block_number += 1
+    assert block_message.generate_signature(signing_key) != signature
@@ -1,5 +1,9 @@
+import copy
 from hashlib import sha3_256
 
+from thenewboston_node.business_logic.models import AccountState, BlockchainState, Node, PrimaryValidatorSchedule
+from thenewboston_node.business_logic.tests.baker_factories import baker
+
 
 def test_normalized_blockchain_state(blockchain_genesis_state):
     assert blockchain_genesis_state.get_normalized() == (
@@ -18,3 +22,53 @@ def test_get_next_block_identifier(blockchain_genesis_state):
 
     blockchain_genesis_state.next_block_identifier = 'next-block-identifier'
     assert blockchain_genesis_state.get_next_block_identifier() == 'next-block-identifier'
+
+
+def test_serialize_to_dict_strips_redundant_account_state_values():
+    node = baker.make(Node, identifier='a' * 64, fee_account=None)
+    blockchain_state = BlockchainState(
+        account_states={
+            'a' * 64: AccountState(balance=1, balance_lock='a' * 64, node=node),
+            'b' * 64: AccountState(balance=2, balance_lock='c' * 64),
+        },
+        last_block_number=3,
+    )
+
+    serialized = blockchain_state.serialize_to_dict()
+    assert list(serialized) == ['account_states', 'last_block_number']
+    assert serialized['account_states'] == {
+        'a' * 64: {
+            'balance': 1,
+            'node': {
+                'network_addresses': node.network_addresses,
+                'fee_amount': node.fee_amount,
+            },
+        },
+        'b' * 64: {
+            'balance': 2,
+            'balance_lock': 'c' * 64
+        },
+    }
+    assert blockchain_state.serialize_to_dict(exclude=('account_states',)) == {'last_block_number': 3}
+
+
+def test_derived_indexes():
+    node = baker.make(Node, identifier='a' * 64)
+    pv_schedule = baker.make(PrimaryValidatorSchedule)
+    blockchain_state = BlockchainState(
+        account_states={
+            'a' * 64: AccountState(balance=1, node=node, primary_validator_schedule=pv_schedule),
+            'b' * 64: AccountState(balance=2),
+        }
+    )
+    assert blockchain_state.get_nodes() == {'a' * 64: node}
+    assert blockchain_state.get_primary_validator_schedules() == {'a' * 64: pv_schedule}
+
+    blockchain_state_copy = copy.deepcopy(blockchain_state)
+    assert '_nodes' not in blockchain_state_copy.__dict__
+    assert blockchain_state_copy == blockchain_state
+
+    another_node = baker.make(Node, identifier='c' * 64)
+    blockchain_state.set_account_state('c' * 64, AccountState(node=another_node))
+    assert blockchain_state.get_nodes() == {'a' * 64: node, 'c' * 64: another_node}
+    assert blockchain_state.get_primary_validator_schedules() == {'a' * 64: pv_schedule}
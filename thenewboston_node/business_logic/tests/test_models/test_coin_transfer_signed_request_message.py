@@ -1,3 +1,5 @@
+from copy import deepcopy
+
 import pytest
 
 from thenewboston_node.business_logic.exceptions import ValidationError
@@ -43,34 +45,36 @@ def test_validate(sample_coin_transfer_signed_request_message):
 
 
 def test_validate_balance_lock(sample_coin_transfer_signed_request_message):
-    sample_coin_transfer_signed_request_message.balance_lock = ''
+    message = deepcopy(sample_coin_transfer_signed_request_message)
+    message.balance_lock = ''
     with pytest.raises(
         ValidationError, match='Coin transfer signed change request message balance lock must be not empty'
     ):
-        sample_coin_transfer_signed_request_message.validate()
+        message.validate()
 
-    sample_coin_transfer_signed_request_message.balance_lock = None
+    message.balance_lock = None
     with pytest.raises(
         ValidationError, match='Coin transfer signed change request message balance lock must be not empty'
     ):
-        sample_coin_transfer_signed_request_message.validate()
+        message.validate()
 
 
 def test_validate_transactions(sample_coin_transfer_signed_request_message: CoinTransferSignedChangeRequestMessage):
-    sample_coin_transfer_signed_request_message.txs[0].amount = -1
+    message = deepcopy(sample_coin_transfer_signed_request_message)
+    message.txs[0].amount = -1
     with pytest.raises(ValidationError, match='Coin transfer transaction amount must be greater or equal to 1'):
-        sample_coin_transfer_signed_request_message.validate()
+        message.validate()
 
-    sample_coin_transfer_signed_request_message.txs[0] = 'dummy'  # type: ignore
+    message.txs[0] = 'dummy'  # type: ignore
     with pytest.raises(
         ValidationError, match='Coin transfer signed change request message txs must be CoinTransferTransaction'
     ):
-        sample_coin_transfer_signed_request_message.validate()
+        message.validate()
 
-    sample_coin_transfer_signed_request_message.txs = 'dummy'  # type: ignore
+    message.txs = 'dummy'  # type: ignore
     with pytest.raises(ValidationError, match='Coin transfer signed change request message txs must be list'):
-        sample_coin_transfer_signed_request_message.validate()
+        message.validate()
 
-    sample_coin_transfer_signed_request_message.txs = []
+    message.txs = []
     with pytest.raises(ValidationError, match='Coin transfer signed change request message txs must be not empty'):
-        sample_coin_transfer_signed_request_message.validate()
+        message.validate()
@@ -1,8 +1,11 @@
 import typing
 
+import msgpack
+
 from thenewboston_node.business_logic.models import BlockchainState
 from thenewboston_node.business_logic.models.mixins.compactable import COMPACT_KEY_MAP
 from thenewboston_node.business_logic.models.mixins.compactable import compact_key as ck
+from thenewboston_node.business_logic.models.mixins.compactable import get_value_transformer
 from thenewboston_node.business_logic.models.mixins.serializable import SerializableMixin
 from thenewboston_node.business_logic.models.signed_change_request.constants import BlockType
 from thenewboston_node.business_logic.tests import baker_factories
@@ -84,3 +87,21 @@ def test_all_hexadecimals_are_binarized():
         block = baker_factories.make_block(block_type.value)
         compacted_dict = block.to_compact_dict()
         assert_instance_is_binarized(block, compacted_dict)
+
+
+def test_to_messagepack_with_reused_packer(blockchain_state_10, block_0):
+    packer = msgpack.Packer()
+    for _ in range(2):
+        assert blockchain_state_10.to_messagepack(packer=packer) == blockchain_state_10.to_messagepack()
+        assert block_0.to_messagepack(packer=packer) == block_0.to_messagepack()
+
+
+def test_get_value_transformer():
+    assert get_value_transformer(int, True) is None
+    assert get_value_transformer(list[int], False) is None
+    assert get_value_transformer(dict[hexstr, int], True) is get_value_transformer(dict[hexstr, int], True)
+
+    account_number = hexstr('ab' * 32)
+    compacted = get_value_transformer(dict[hexstr, list[hexstr]], True)({account_number: [account_number]})
+    assert compacted == {bytes.fromhex(account_number): [bytes.fromhex(account_number)]}
+    assert get_value_transformer(dict[hexstr, list[hexstr]], False)(compacted) == {account_number: [account_number]}
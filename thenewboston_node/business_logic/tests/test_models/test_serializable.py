@@ -0,0 +1,29 @@
+from copy import deepcopy
+
+from thenewboston_node.business_logic.models import Block, BlockchainState
+from thenewboston_node.business_logic.models.mixins.serializable import serialize_value
+
+
+def test_serialize_to_dict_matches_generic_serialization(block_message):
+    for skip_none_values in (True, False):
+        for coerce_to_json_types in (True, False):
+            expected = {
+                field_name:
+                serialize_value(getattr(block_message, field_name), skip_none_values, coerce_to_json_types)
+                for field_name in block_message.get_field_names()
+            }
+            assert block_message.serialize_to_dict(
+                skip_none_values=skip_none_values, coerce_to_json_types=coerce_to_json_types
+            ) == expected
+
+
+def test_codec_is_resolved_once_per_class():
+    assert Block.get_codec() is Block.get_codec()
+
+
+def test_blockchain_state_serialization_round_trip(blockchain_state_10):
+    serialized = blockchain_state_10.serialize_to_dict()
+    assert BlockchainState.deserialize_from_dict(deepcopy(serialized)).serialize_to_dict() == serialized
+
+    messagepack = blockchain_state_10.to_messagepack()
+    assert BlockchainState.from_messagepack(messagepack).to_messagepack() == messagepack
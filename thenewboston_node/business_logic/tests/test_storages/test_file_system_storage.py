@@ -1,13 +1,26 @@
+import gzip
 import os.path
+import stat
+import threading
+import time
+from unittest.mock import Mock, call, patch
 
+import msgpack
 import pytest
 
 from thenewboston_node.business_logic import exceptions
-from thenewboston_node.business_logic.storages.file_system import FileSystemStorage
-from thenewboston_node.business_logic.tests.test_storages.utils import compress, decompress
+from thenewboston_node.business_logic.storages.file_system import (
+    COMPRESSION_FUNCTIONS, COMPRESSION_WRITER_FUNCTIONS, DECOMPRESSION_FUNCTIONS, DECOMPRESSION_OPEN_FUNCTIONS,
+    MIN_COMPRESSIBLE_SIZE, FileSystemStorage, compress_to_file, get_directory_listing, strip_compression_extension,
+    train_zstd_dictionary, zstandard
+)
+from thenewboston_node.business_logic.tests.test_storages.utils import compress, decompress, mkdir_and_touch
 
+COMPRESS_TO_FILE_PATH = 'thenewboston_node.business_logic.storages.file_system.compress_to_file'
+COMPRESSIONS = ('gz', 'bz2', 'xz', pytest.param('zst', marks=pytest.mark.skipif(not zstandard, reason='No zstd')))
 
-@pytest.mark.parametrize('compression', ('gz', 'bz2', 'xz'))
+
+@pytest.mark.parametrize('compression', COMPRESSIONS)
 def test_can_load_compressed_file(blockchain_path, compression, compressible_data):
     fss = FileSystemStorage(blockchain_path)
     compressed_path = blockchain_path / f'file.txt.{compression}'
@@ -18,6 +31,49 @@ def test_can_load_compressed_file(blockchain_path, compression, compressible_dat
     assert loaded_data == compressible_data
 
 
+def test_can_load_multiple_member_gzip_file(blockchain_path, compressible_data):
+    fss = FileSystemStorage(blockchain_path)
+    compressed_data = gzip.compress(compressible_data) + gzip.compress(b'extra data')
+    (blockchain_path / 'file.txt.gz').write_bytes(compressed_data)
+
+    assert fss.load('file.txt') == compressible_data + b'extra data'
+
+
+def test_can_load_multiple_member_gzip_file_with_equal_member_sizes(blockchain_path):
+    fss = FileSystemStorage(blockchain_path)
+    compressed_data = gzip.compress(b'a' * 100) + gzip.compress(b'b' * 100)
+    (blockchain_path / 'file.txt.gz').write_bytes(compressed_data)
+
+    assert fss.load('file.txt') == b'a' * 100 + b'b' * 100
+
+
+def test_load_raises_on_truncated_gzip_file(blockchain_path, compressible_data):
+    fss = FileSystemStorage(blockchain_path)
+    (blockchain_path / 'file.txt.gz').write_bytes(gzip.compress(compressible_data)[:-10])
+
+    with pytest.raises(EOFError):
+        fss.load('file.txt')
+
+
+@pytest.mark.parametrize('compression', COMPRESSIONS)
+def test_can_open_stream_of_compressed_file(blockchain_path, compression, compressible_data):
+    fss = FileSystemStorage(blockchain_path)
+    compressed_path = blockchain_path / f'file.txt.{compression}'
+
+    compress(compressed_path, compression, compressible_data)
+
+    with fss.open_stream('file.txt') as fo:
+        assert fo.read() == compressible_data
+
+
+def test_can_open_stream_of_raw_file(blockchain_path, compressible_data):
+    fss = FileSystemStorage(blockchain_path, compressors=())
+    fss.save('file.txt', binary_data=compressible_data, is_final=True)
+
+    with fss.open_stream('file.txt') as fo:
+        assert fo.read() == compressible_data
+
+
 @pytest.mark.parametrize('compression', ('gz', 'bz2', 'xz'))
 def test_incompressible_data_is_saved_raw(blockchain_path, compression, incompressible_data):
     fss = FileSystemStorage(blockchain_path)
@@ -39,7 +95,7 @@ def test_no_compression_file_storage_saves_raw_files(blockchain_path, compressib
     assert file_path.read_bytes() == compressible_data
 
 
-@pytest.mark.parametrize('compression', ('gz', 'bz2', 'xz'))
+@pytest.mark.parametrize('compression', COMPRESSIONS)
 def test_finalized_data_is_compressed(blockchain_path, compression, compressible_data):
     fss = FileSystemStorage(blockchain_path, compressors=(compression,))
     file_path = blockchain_path / f'file.txt.{compression}'
@@ -144,3 +200,273 @@ def test_cannot_use_absolute_path(blockchain_path, compressible_data):
 
     with pytest.raises(ValueError):
         fss.save(file_path, compressible_data)
+
+
+def test_finalized_save_does_not_write_uncompressed_file(blockchain_path, compressible_data):
+    fss = FileSystemStorage(blockchain_path, compressors=('gz',))
+    fss.save('file.txt', b'non finalized data')
+
+    with patch.object(fss, '_write_file', wraps=fss._write_file) as write_file_mock:
+        fss.save('file.txt', compressible_data, is_final=True)
+
+    # Compressed data is streamed to a temporary file which is moved in place
+    write_file_mock.assert_not_called()
+    assert not list((blockchain_path / '.tmp').iterdir())
+    assert not (blockchain_path / 'file.txt').exists()
+    assert fss.load('file.txt') == compressible_data
+    assert fss.is_finalized('file.txt')
+
+
+def test_speed_tier_compressors(blockchain_path):
+    assert FileSystemStorage(blockchain_path, speed_tier='archival').compressors == ('xz', 'bz2', 'gz')
+    expected_compressors = ('zst',) if zstandard else ('gz',)
+    assert FileSystemStorage(blockchain_path, speed_tier='balanced').compressors == expected_compressors
+    assert FileSystemStorage(blockchain_path, speed_tier='fast').compressors[0] in ('lz4', 'zst', 'gz')
+
+    with pytest.raises(ValueError):
+        FileSystemStorage(blockchain_path, speed_tier='unknown')
+
+
+def test_default_compressors_do_not_require_optional_packages(blockchain_path):
+    assert FileSystemStorage(blockchain_path).compressors == ('gz', 'bz2', 'xz')
+
+    with pytest.raises(ValueError, match='Compressors are not available'):
+        FileSystemStorage(blockchain_path, compressors=('gz', 'unknown'))
+
+
+def test_file_compressed_with_unavailable_compressor_is_not_skipped(blockchain_path):
+    fss = FileSystemStorage(blockchain_path)
+    mkdir_and_touch(blockchain_path / 'file.txt.zst')
+
+    with patch.dict(DECOMPRESSION_FUNCTIONS), patch.dict(DECOMPRESSION_OPEN_FUNCTIONS):
+        DECOMPRESSION_FUNCTIONS.pop('zst', None)
+        DECOMPRESSION_OPEN_FUNCTIONS.pop('zst', None)
+
+        assert fss.exists('file.txt')
+        with pytest.raises(exceptions.StorageError, match='zst decompression is not available'):
+            fss.load('file.txt')
+        with pytest.raises(exceptions.StorageError, match='zst decompression is not available'):
+            fss.open_stream('file.txt')
+
+
+def test_small_data_is_not_compressed(blockchain_path, compressible_data):
+    fss = FileSystemStorage(blockchain_path, compressors=('gz',))
+    small_data = compressible_data[:MIN_COMPRESSIBLE_SIZE - 1]
+
+    with patch.dict(COMPRESSION_WRITER_FUNCTIONS, {'gz': Mock(wraps=COMPRESSION_WRITER_FUNCTIONS['gz'])}):
+        fss.save('small.txt', small_data, is_final=True)
+        COMPRESSION_WRITER_FUNCTIONS['gz'].assert_not_called()
+
+        fss.save('file.txt', compressible_data, is_final=True)
+        COMPRESSION_WRITER_FUNCTIONS['gz'].assert_called_once()
+
+    assert (blockchain_path / 'small.txt').read_bytes() == small_data
+    assert (blockchain_path / 'file.txt.gz').exists()
+
+
+def test_get_directory_listing_is_cached_until_directory_is_modified(blockchain_path):
+    fss = FileSystemStorage(blockchain_path, compressors=('gz',))
+    fss.save('file.txt', b'A' * 1000, is_final=True)
+    directory = str(blockchain_path)
+    old_mtime_ns = os.stat(directory).st_mtime_ns - 10_000_000_000
+    os.utime(directory, ns=(old_mtime_ns, old_mtime_ns))
+    assert 'file.txt.gz' in get_directory_listing(directory)
+
+    with patch('os.scandir') as scandir_mock:
+        assert fss.load('file.txt') == b'A' * 1000
+        assert fss.is_finalized('file.txt')
+
+    scandir_mock.assert_not_called()
+
+    fss.save('another_file.txt', b'A' * 1000, is_final=True)
+    assert 'another_file.txt.gz' in get_directory_listing(directory)
+
+
+def test_relative_path_is_normalized(blockchain_path):
+    fss = FileSystemStorage(blockchain_path)
+    fss.save('subdir/../file.txt', b'AAA')
+
+    assert fss.load('./file.txt') == b'AAA'
+    assert (blockchain_path / 'file.txt').read_bytes() == b'AAA'
+
+
+def test_absolute_base_path_is_not_resolved(blockchain_path):
+    with patch('pathlib.Path.resolve') as resolve_mock:
+        fss = FileSystemStorage(f'{blockchain_path}/subdir/../')
+
+    resolve_mock.assert_not_called()
+    assert fss.base_path == blockchain_path
+    fss.save('file.txt', b'AAA')
+    assert (blockchain_path / 'file.txt').read_bytes() == b'AAA'
+
+
+def test_directories_are_created_once(blockchain_path):
+    fss = FileSystemStorage(blockchain_path, compressors=())
+    with patch('os.makedirs', wraps=os.makedirs) as makedirs_mock:
+        fss.save('subdir/file1.txt', b'AAA')
+        fss.save('subdir/file2.txt', b'AAA')
+        fss.move('subdir/file1.txt', 'subdir/file3.txt')
+
+    assert makedirs_mock.call_args_list == [
+        call(str(blockchain_path / 'subdir'), exist_ok=True),
+        call(blockchain_path / '.tmp', exist_ok=True),
+    ]
+
+    fss.clear()
+    fss.save('subdir/file1.txt', b'AAA')
+    assert fss.load('subdir/file1.txt') == b'AAA'
+
+
+def test_strip_compression_extension():
+    assert strip_compression_extension('file.txt.gz') == 'file.txt'
+    assert strip_compression_extension('file.txt.xz') == 'file.txt'
+    assert strip_compression_extension('file.txt') == 'file.txt'
+    assert strip_compression_extension('file.gz.txt') == 'file.gz.txt'
+    assert strip_compression_extension('gz') == 'gz'
+
+
+@pytest.mark.skipif(not zstandard, reason='No zstd')
+def test_appended_data_is_compressed_frame_by_frame(blockchain_path, compressible_data):
+    fss = FileSystemStorage(blockchain_path, compressors=('zst', 'gz'), framed_append=True)
+    fss.append('file.txt', compressible_data)
+    fss.append('file.txt', b'appended data')
+    fss.move('file.txt', 'moved.txt')
+    assert not fss.is_finalized('moved.txt')
+
+    with patch.object(fss, '_compress') as compress_mock:
+        fss.append('moved.txt', compressible_data, is_final=True)
+
+    compress_mock.assert_not_called()
+    assert fss.is_finalized('moved.txt')
+    assert not (blockchain_path / 'moved.txt').exists()
+    expected_data = compressible_data + b'appended data' + compressible_data
+    assert fss.load('moved.txt') == expected_data
+    with fss.open_stream('moved.txt') as fo:
+        assert fo.read() == expected_data
+
+    with pytest.raises(exceptions.FinalizedFileWriteError):
+        fss.append('moved.txt', b'appended data')
+
+
+def test_framed_append_is_opt_in(blockchain_path, compressible_data):
+    fss = FileSystemStorage(blockchain_path)
+    fss.append('file.txt', compressible_data)
+    assert (blockchain_path / 'file.txt').read_bytes() == compressible_data
+    assert not (blockchain_path / 'file.txt.zst').exists()
+
+    with patch.dict(COMPRESSION_FUNCTIONS):
+        COMPRESSION_FUNCTIONS.pop('zst', None)
+        with pytest.raises(ValueError, match='zstandard package is required to use framed append'):
+            FileSystemStorage(blockchain_path, framed_append=True)
+
+
+@pytest.mark.skipif(not zstandard, reason='zstandard is not installed')
+def test_zstd_dictionary_is_used(blockchain_path, tmp_path):
+    samples = [
+        msgpack.packb({
+            'block_number': block_number,
+            'recipient': os.urandom(32).hex(),
+            'signature': os.urandom(64).hex(),
+        }) for block_number in range(200)
+    ]
+    dictionary_path = tmp_path / 'dictionary'
+    dictionary_path.write_bytes(train_zstd_dictionary(samples, dict_size=4096))
+    data = b''.join(samples[:5])
+
+    FileSystemStorage(blockchain_path, compressors=('zst',)).save('plain.msgpack', data, is_final=True)
+    fss = FileSystemStorage(blockchain_path, compressors=('zst',), zstd_dictionary_path=dictionary_path)
+    fss.save('file.msgpack', data, is_final=True)
+    fss.append('appended.msgpack', data)
+    fss.finalize('appended.msgpack')
+
+    compressed_path = blockchain_path / 'file.msgpack.zst'
+    assert compressed_path.stat().st_size < (blockchain_path / 'plain.msgpack.zst').stat().st_size
+    for file_path in ('file.msgpack', 'appended.msgpack', 'plain.msgpack'):
+        assert fss.load(file_path) == data
+        with fss.open_stream(file_path) as fo:
+            assert fo.read() == data
+
+    with pytest.raises(zstandard.ZstdError):
+        FileSystemStorage(blockchain_path).load('file.msgpack')
+
+
+@pytest.mark.parametrize('data', (b'', b'A' * 10000))
+def test_appended_file_is_finalized(blockchain_path, data):
+    fss = FileSystemStorage(blockchain_path, compressors=('gz', 'bz2'))
+    fss.append('file.txt', data)
+    fss.finalize('file.txt')
+
+    assert fss.is_finalized('file.txt')
+    assert fss.load('file.txt') == data
+
+
+@pytest.mark.parametrize('compressors', ((), ('gz',)))
+def test_finalized_file_is_read_only(blockchain_path, compressible_data, compressors):
+    fss = FileSystemStorage(blockchain_path, compressors=compressors)
+    fss.save('file.txt', compressible_data, is_final=True)
+
+    file_path = blockchain_path / ('file.txt.gz' if compressors else 'file.txt')
+    assert stat.S_IMODE(os.stat(file_path).st_mode) == 0o400
+
+
+def test_finalized_file_is_committed_read_only(blockchain_path, compressible_data):
+    fss = FileSystemStorage(blockchain_path, compressors=('gz',))
+    fss.append('file.txt', compressible_data)
+
+    with patch('os.chmod') as chmod_mock:
+        fss.finalize('file.txt')
+        fss.save('saved.txt', compressible_data, is_final=True)
+        fss.save('random.bin', os.urandom(1000), is_final=True)
+
+    chmod_mock.assert_not_called()
+    assert stat.S_IMODE(os.stat(blockchain_path / 'random.bin').st_mode) == 0o400
+    assert stat.S_IMODE(os.stat(blockchain_path / 'file.txt.gz').st_mode) == 0o400
+    assert stat.S_IMODE(os.stat(blockchain_path / 'saved.txt.gz').st_mode) == 0o400
+
+
+def test_finalized_state_is_cached(blockchain_path, compressible_data):
+    fss = FileSystemStorage(blockchain_path, compressors=('gz',))
+    fss.append('file.txt', compressible_data)
+    assert not fss.is_finalized('file.txt')
+    fss.finalize('file.txt')
+    assert fss.is_finalized('file.txt')
+
+    with patch.object(fss, '_probe_is_finalized') as probe_is_finalized_mock:
+        assert fss.is_finalized('file.txt')
+        with pytest.raises(exceptions.FinalizedFileWriteError):
+            fss.append('file.txt', compressible_data)
+
+    probe_is_finalized_mock.assert_not_called()
+
+
+def test_absolute_paths_are_reused(blockchain_path):
+    fss = FileSystemStorage(blockchain_path)
+    abs_path = fss._get_absolute_path('subdir/file.txt')
+    assert abs_path == blockchain_path / 'subdir/file.txt'
+    assert fss._get_absolute_path('subdir/file.txt') is abs_path
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            fss._get_absolute_path('../file.txt')
+
+
+def test_temporary_files_are_removed_after_all_compressions_finish(blockchain_path, compressible_data):
+    fss = FileSystemStorage(blockchain_path, compressors=('gz', 'bz2'))
+    is_slower_compression_finished = threading.Event()
+
+    def compress_to_file_mock(open_writer, data, file_path):
+        if file_path.endswith('.gz'):
+            raise ValueError('Compression failed')
+
+        # Slower compression (re)creates its temporary file after the other compression failed
+        time.sleep(0.2)
+        try:
+            return compress_to_file(open_writer, data, file_path)
+        finally:
+            is_slower_compression_finished.set()
+
+    with patch(COMPRESS_TO_FILE_PATH, compress_to_file_mock), pytest.raises(ValueError):
+        fss.save('file.txt', compressible_data, is_final=True)
+
+    assert is_slower_compression_finished.wait(timeout=5)
+    assert os.listdir(blockchain_path / '.tmp') == []
@@ -6,11 +6,14 @@ from unittest.mock import patch
 
 import pytest
 
+from thenewboston_node.business_logic.storages.file_system import COMPRESSION_EXTENSIONS
 from thenewboston_node.business_logic.storages.path_optimized_file_system import (
-    PathOptimizedFileSystemStorage, make_optimized_file_path
+    PathOptimizedFileSystemStorage, make_optimized_file_path, walk_files
 )
 from thenewboston_node.business_logic.tests.test_storages.utils import mkdir_and_touch
 
+WALK_FILES_PATH = 'thenewboston_node.business_logic.storages.path_optimized_file_system.walk_files'
+
 
 def test_make_optimized_file_path():
     assert make_optimized_file_path('a', 0) == 'a'
@@ -52,6 +55,13 @@ def test_can_save(blockchain_path, base_filename, optimized_file_path):
         assert fo.read() == b'\x08Test'
 
 
+def test_make_optimized_file_path_is_cached():
+    make_optimized_file_path('/d/abc.json', 3)
+    hits = make_optimized_file_path.cache_info().hits
+    assert make_optimized_file_path('/d/abc.json', 3) == '/d/a/b/c/abc.json'
+    assert make_optimized_file_path.cache_info().hits == hits + 1
+
+
 def test_can_save_finalize(blockchain_path, base_filename, optimized_file_path):
     fss = PathOptimizedFileSystemStorage(base_path=blockchain_path)
     fss.save(base_filename, b'\x08Test', is_final=True)
@@ -154,20 +164,35 @@ def test_can_finalize_to_optimized_path(blockchain_path):
     finalize_mock.assert_called_once_with(blockchain_path / 'parent/f/i/l/e/file.txt')
 
 
+def test_walk_files(blockchain_path):
+    mkdir_and_touch(blockchain_path / 'a/a.txt')
+    mkdir_and_touch(blockchain_path / 'a/b/ab.txt')
+    mkdir_and_touch(blockchain_path / 'z/z.txt')
+    os.symlink(blockchain_path / 'a', blockchain_path / 'z/link')
+    os.symlink(blockchain_path / 'a/a.txt', blockchain_path / 'z/link.txt')
+
+    assert sorted((dir_path, sorted(filenames)) for dir_path, filenames in walk_files(str(blockchain_path))) == [
+        (str(blockchain_path), []),
+        (str(blockchain_path / 'a'), ['a.txt']),
+        (str(blockchain_path / 'a/b'), ['ab.txt']),
+        (str(blockchain_path / 'z'), ['link.txt', 'z.txt']),
+    ]
+
+
 def test_list_optimized_sorting_is_correct(blockchain_path):
     return_value = [
-        (str(blockchain_path / 'a'), ('b',), ('a.txt',)),
-        (str(blockchain_path / 'a/b'), (), ('ab.txt',)),
-        (str(blockchain_path / 'z'), (), ('z.txt',)),
+        (str(blockchain_path / 'a'), ['a.txt']),
+        (str(blockchain_path / 'a/b'), ['ab.txt']),
+        (str(blockchain_path / 'z'), ['z.txt']),
     ]
     storage = PathOptimizedFileSystemStorage(blockchain_path)
 
-    with patch('os.walk') as os_walk_mock:
-        os_walk_mock.return_value = return_value
+    with patch(WALK_FILES_PATH) as walk_files_mock:
+        walk_files_mock.return_value = return_value
         assert list(storage.list_directory()) == ['a.txt', 'ab.txt', 'z.txt']
 
-    with patch('os.walk') as os_walk_mock:
-        os_walk_mock.return_value = return_value
+    with patch(WALK_FILES_PATH) as walk_files_mock:
+        walk_files_mock.return_value = return_value
         assert list(storage.list_directory(sort_direction=-1)) == ['z.txt', 'ab.txt', 'a.txt']
 
 
@@ -220,7 +245,7 @@ def test_non_optimized_paths_are_not_listed(blockchain_path):
     assert listed == []
 
 
-@pytest.mark.parametrize('compression', ('gz', 'bz2', 'xz'))
+@pytest.mark.parametrize('compression', sorted(COMPRESSION_EXTENSIONS))
 def test_list_directory_strips_compression_extensions(blockchain_path, compression):
     storage = PathOptimizedFileSystemStorage(blockchain_path)
 
@@ -272,3 +297,17 @@ def test_move(blockchain_path):
     assert os.path.isfile(str(blockchain_path / 'f/i/l/e/2/file2.txt'))
     assert not os.path.isfile(str(blockchain_path / 'f/i/l/e/1/file1.txt'))
     assert storage.load(destination) == b'AAA'
+
+
+def test_has_file_with_prefix(blockchain_path):
+    storage = PathOptimizedFileSystemStorage(blockchain_path, max_depth=4)
+    storage.save('dir/abcd-1.txt', b'AAA', is_final=True)
+    mkdir_and_touch(blockchain_path / 'dir/a/b/c/d/abcd-2.txt.gz')
+
+    assert storage.has_file_with_prefix('dir/abcd-')
+    assert storage.has_file_with_prefix('dir/abcd-2')
+    assert not storage.has_file_with_prefix('dir/abcd-3')
+    assert not storage.has_file_with_prefix('abcd-')
+
+    with pytest.raises(ValueError, match='File name prefix is too short'):
+        storage.has_file_with_prefix('dir/abc')
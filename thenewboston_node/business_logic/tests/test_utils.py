@@ -1,10 +1,17 @@
+import gzip
+import io
 import json
 import tempfile
+from unittest.mock import patch
 
 from django.test import override_settings
 
 from thenewboston_node.business_logic.blockchain.base import BlockchainBase
-from thenewboston_node.business_logic.utils.blockchain_state import add_blockchain_state_from_account_root_file
+from thenewboston_node.business_logic.utils import network
+from thenewboston_node.business_logic.utils.blockchain_state import (
+    add_blockchain_state_from_account_root_file, read_source
+)
+from thenewboston_node.business_logic.utils.network import get_network_addresses
 
 
 @override_settings(
@@ -31,3 +38,35 @@ def test_make_blockchain_state_from_account_root_file(sample_account_root_file_d
             assert account_state.balance_lock is None
 
         assert account_state.node is None
+
+
+def test_read_source_accepts_gzip_encoded_response(sample_account_root_file_dict):
+    response = io.BytesIO(gzip.compress(json.dumps(sample_account_root_file_dict).encode('utf-8')))
+    response.headers = {'Content-Encoding': 'gzip'}  # type: ignore
+    with patch('thenewboston_node.business_logic.utils.blockchain_state.urlopen', return_value=response) as urlopen:
+        assert read_source('http://example.com/account-root-file.json') == sample_account_root_file_dict
+
+    assert urlopen.call_args.args[0].get_header('Accept-encoding') == 'gzip'
+    assert response.closed
+
+
+@override_settings(
+    NODE_NETWORK_ADDRESSES=[],
+    APPEND_AUTO_DETECTED_NETWORK_ADDRESS=True,
+    NODE_SCHEME='http',
+    NODE_PORT=8555,
+    NODE_STUN_CACHE_TTL=300
+)
+def test_external_ip_address_is_cached():
+    ip_info = ('Full Cone', '1.2.3.4', 54320)
+    with patch.object(network, '_external_ip_address_cache', None):
+        with patch('stun.get_ip_info', return_value=ip_info) as get_ip_info_mock:
+            assert get_network_addresses() == ['http://1.2.3.4:8555/']
+            assert get_network_addresses() == ['http://1.2.3.4:8555/']
+
+            get_ip_info_mock.assert_called_once()
+
+            with override_settings(NODE_STUN_CACHE_TTL=0):
+                assert get_network_addresses() == ['http://1.2.3.4:8555/']
+
+            assert get_ip_info_mock.call_count == 2
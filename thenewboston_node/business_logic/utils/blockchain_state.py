@@ -1,10 +1,17 @@
+import gzip
+import io
 import json
 import logging
-from contextlib import closing
-from urllib.request import urlopen
+from contextlib import ExitStack, closing, contextmanager
+from urllib.request import Request, urlopen
 
 from django.conf import settings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from thenewboston_node.business_logic.models import AccountState, BlockchainState
 from thenewboston_node.business_logic.models.signed_change_request_message.pv_schedule import PrimaryValidatorSchedule
 from thenewboston_node.core.utils.misc import is_valid_url
@@ -12,13 +19,27 @@ from thenewboston_node.core.utils.misc import is_valid_url
 logger = logging.getLogger()
 
 
+@contextmanager
+def open_source(source):
+    """Yield text file object to read `source` (URL or file path) from"""
+    with ExitStack() as stack:
+        if is_valid_url(source):
+            # Account root files are well compressible, so we ask for compressed response
+            response = stack.enter_context(closing(urlopen(Request(source, headers={'Accept-Encoding': 'gzip'}))))
+            if response.headers.get('Content-Encoding') == 'gzip':
+                response = gzip.GzipFile(fileobj=response)
+            fp = io.TextIOWrapper(response, encoding='utf-8')
+        else:
+            fp = open(source)
+
+        yield stack.enter_context(closing(fp))
+
+
 def read_source(source):
-    if is_valid_url(source):
-        fp = urlopen(source)
-    else:
-        fp = open(source)
+    with open_source(source) as fp:
+        if orjson:
+            return orjson.loads(fp.read())
 
-    with closing(fp) as fp:
         return json.load(fp)
 
 
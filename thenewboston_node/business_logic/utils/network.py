@@ -1,4 +1,5 @@
 import logging
+import time
 
 from django.conf import settings
 
@@ -9,20 +10,39 @@ from thenewboston_node.business_logic.node import derive_public_key, get_node_si
 
 logger = logging.getLogger(__name__)
 
+# (monotonic time of detection, external IP address)
+_external_ip_address_cache = None
+
+
+def get_external_ip_address():
+    """Return external IP address detected with STUN (it is cached for `NODE_STUN_CACHE_TTL` seconds, since
+    detection takes network round-trips)
+    """
+    global _external_ip_address_cache
+
+    cached = _external_ip_address_cache
+    now = time.monotonic()
+    if cached and now - cached[0] < settings.NODE_STUN_CACHE_TTL:
+        return cached[1]
+
+    logger.info('Detecting external IP address')
+    _, external_ip_address, _ = stun.get_ip_info()
+    logger.info('External IP address: %s', external_ip_address)
+    _external_ip_address_cache = (now, external_ip_address)
+    return external_ip_address
+
 
 def get_network_addresses():
     network_addresses = settings.NODE_NETWORK_ADDRESSES
     if settings.APPEND_AUTO_DETECTED_NETWORK_ADDRESS:
         try:
-            logger.info('Detecting external IP address')
-            _, external_ip_address, _ = stun.get_ip_info()
-            logger.info('External IP address: %s', external_ip_address)
+            external_ip_address = get_external_ip_address()
         except Exception:
             logger.warning('Unable to detect external IP address')
         else:
             network_address = f'{settings.NODE_SCHEME}://{external_ip_address}:{settings.NODE_PORT}/'
-            network_addresses = list(network_addresses)
-            network_addresses.append(network_address)
+            # Built in one go (`Node.network_addresses` is a list, so list is returned rather than tuple)
+            network_addresses = [*network_addresses, network_address]
 
     return network_addresses
 
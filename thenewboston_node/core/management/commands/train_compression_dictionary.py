@@ -0,0 +1,27 @@
+from itertools import islice
+
+from django.core.management import BaseCommand
+
+from thenewboston_node.business_logic.blockchain.base import BlockchainBase
+from thenewboston_node.business_logic.storages.file_system import ZSTD_DICTIONARY_SIZE, train_zstd_dictionary
+
+DEFAULT_MAX_SAMPLES = 1000
+
+
+class Command(BaseCommand):
+    help = 'Train zstd dictionary on block chunks (to be used as blocks storage `zstd_dictionary_path`)'  # noqa: A003
+
+    def add_arguments(self, parser):
+        parser.add_argument('output_path')
+        parser.add_argument('--dict-size', type=int, default=ZSTD_DICTIONARY_SIZE)
+        parser.add_argument('--max-samples', type=int, default=DEFAULT_MAX_SAMPLES)
+
+    def handle(self, output_path, *args, **options):
+        block_storage = BlockchainBase.get_instance().block_storage
+        file_paths = islice(block_storage.list_directory(sort_direction=-1), options['max_samples'])
+        samples = [block_storage.load(file_path) for file_path in file_paths]
+        dictionary = train_zstd_dictionary(samples, dict_size=options['dict_size'])
+        with open(output_path, 'wb') as fo:
+            fo.write(dictionary)
+
+        self.stdout.write(f'Trained {len(dictionary)} bytes dictionary on {len(samples)} samples')
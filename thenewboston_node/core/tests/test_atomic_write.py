@@ -1,6 +1,10 @@
+import os
+import stat
+from unittest.mock import Mock, patch
+
 import pytest
 
-from thenewboston_node.core.utils.atomic_write import atomic_write_append
+from thenewboston_node.core.utils.atomic_write import IS_UNNAMED_FILE_SUPPORTED, atomic_write_append
 
 
 def test_can_append_atomic_to_existing_file(tmp_path):
@@ -13,6 +17,20 @@ def test_can_append_atomic_to_existing_file(tmp_path):
     assert tmp_file.read_text() == 'Hello world'
 
 
+@pytest.mark.parametrize('is_sendfile_supported', (True, False))
+def test_can_append_binary_data_atomic_to_existing_file(tmp_path, is_sendfile_supported):
+    tmp_file = tmp_path / 'testfile'
+
+    tmp_file.write_bytes(b'Hello ' * 10000)
+    sendfile_mock = Mock(wraps=os.sendfile) if is_sendfile_supported else Mock(side_effect=OSError)
+    with patch('os.sendfile', sendfile_mock):
+        with atomic_write_append(tmp_file, mode='ab') as f:
+            f.write(b'world')
+
+    assert sendfile_mock.called
+    assert tmp_file.read_bytes() == b'Hello ' * 10000 + b'world'
+
+
 @pytest.mark.parametrize('mode,data', [
     ('a', 'test'),
     ('ab', b'test'),
@@ -54,3 +72,39 @@ def test_file_is_not_created_on_error(tmp_path):
         pass
 
     assert not tmp_file.exists()
+
+
+@pytest.mark.parametrize('mode', ('wb', 'ab'))
+def test_file_mode_is_set(tmp_path, mode):
+    tmp_file = tmp_path / 'testfile'
+
+    with atomic_write_append(tmp_file, mode=mode, file_mode=0o400) as f:
+        f.write(b'test')
+
+    assert stat.S_IMODE(tmp_file.stat().st_mode) == 0o400
+    assert tmp_file.read_bytes() == b'test'
+
+
+@pytest.mark.skipif(not IS_UNNAMED_FILE_SUPPORTED, reason='Unnamed files are not supported')
+def test_write_does_not_create_temporary_file(tmp_path):
+    tmp_file = tmp_path / 'testfile'
+
+    with atomic_write_append(tmp_file, mode='wb', dir=tmp_path / 'tmp') as f:
+        f.write(b'test')
+        assert list(tmp_path.iterdir()) == []
+
+    assert list(tmp_path.iterdir()) == [tmp_file]
+    assert tmp_file.read_bytes() == b'test'
+
+
+@pytest.mark.parametrize('is_unnamed_file_supported', (True, False))
+def test_write_does_not_overwrite_existing_file(tmp_path, is_unnamed_file_supported):
+    tmp_file = tmp_path / 'testfile'
+    tmp_file.write_bytes(b'first')
+
+    with patch('thenewboston_node.core.utils.atomic_write.IS_UNNAMED_FILE_SUPPORTED', is_unnamed_file_supported):
+        with pytest.raises(FileExistsError):
+            with atomic_write_append(tmp_file, mode='wb') as f:
+                f.write(b'second')
+
+    assert tmp_file.read_bytes() == b'first'
@@ -1,4 +1,4 @@
-from thenewboston_node.core.utils.collections import replace_keys
+from thenewboston_node.core.utils.collections import LRUCache, replace_keys
 
 
 def test_replace_keys():
@@ -12,6 +12,7 @@ def test_replace_keys():
     }
     assert replace_keys({'long_a': 1}, replace_map) == {'a': 1}
     assert replace_keys([{'long_a': 1}], replace_map) == [{'a': 1}]
+    assert replace_keys(({'long_a': 1},), replace_map) == ({'a': 1},)
     assert replace_keys({'long_a': 1, 'long_b': 2}, replace_map) == {'a': 1, 'b': 2}
     assert replace_keys({
         'long_a': 1,
@@ -69,3 +70,19 @@ def test_replace_keys():
             'd': [1, 2, 3]
         }, 2, 3]
     }
+
+
+def test_lru_cache():
+    cache = LRUCache(2)
+    cache['a'] = 1
+    cache['b'] = 2
+    assert cache.get('a') == 1
+
+    cache['c'] = 3
+    assert 'b' not in cache
+    assert cache.get('b') is None
+    assert list(cache.items()) == [('a', 1), ('c', 3)]
+
+    cache['a'] = 4
+    cache['d'] = 5
+    assert list(cache.items()) == [('a', 4), ('d', 5)]
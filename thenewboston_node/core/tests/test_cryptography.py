@@ -1,4 +1,4 @@
-from thenewboston_node.core.utils.cryptography import derive_public_key, generate_key_pair
+from thenewboston_node.core.utils.cryptography import derive_public_key, generate_key_pair, normalize_dict
 
 
 def test_generate_key_pair():
@@ -11,3 +11,7 @@ def test_generate_key_pair():
     derived_public = derive_public_key(key_pair.private)
     assert derived_public == key_pair.public
     assert derived_public is not key_pair.public
+
+
+def test_normalize_dict():
+    assert normalize_dict({'b': {'d': [1, 2], 'c': None}, 'a': 'ф'}) == b'{"a":"\\u0444","b":{"c":null,"d":[1,2]}}'
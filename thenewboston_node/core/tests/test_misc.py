@@ -1,5 +1,14 @@
-from thenewboston_node.core.utils.misc import humanize_camel_case
+from thenewboston_node.core.utils.misc import humanize_camel_case, is_valid_url
 
 
 def test_humanize_camel_case():
     assert humanize_camel_case('ThisIsACamelCase') == 'This is a camel case'
+
+
+def test_is_valid_url():
+    assert is_valid_url('http://example.com/arf.json')
+    assert is_valid_url('https://example.com/arf.json')
+    assert not is_valid_url('http://example.com')
+    assert not is_valid_url('/tmp/arf.json')
+    assert not is_valid_url('arf.json')
+    assert not is_valid_url('//example.com/arf.json')
@@ -1,18 +1,90 @@
 import contextlib
+import os
 import shutil
 from pathlib import Path
 
 import atomicwrites
 
+PROC_SELF_FD = '/proc/self/fd'
+O_TMPFILE = getattr(os, 'O_TMPFILE', None)  # Linux only
+IS_UNNAMED_FILE_SUPPORTED = O_TMPFILE is not None and os.path.isdir(PROC_SELF_FD)
+UNNAMED_FILE_MODE = 0o600  # the same mode `tempfile.mkstemp()` creates files with
+SENDFILE_CHUNK_SIZE = 1024 * 1024 * 1024
+
+
+def copy_file_data(source_fo, destination_fo):
+    """Copy data of the (whole) source file to the current position of the destination file in kernel
+    (without reading it to user space) if possible
+    """
+    destination_fo.flush()
+    source_fd = source_fo.fileno()
+    destination_fd = destination_fo.fileno()
+    offset = 0
+    try:
+        while sent := os.sendfile(destination_fd, source_fd, offset, SENDFILE_CHUNK_SIZE):
+            offset += sent
+    except OSError:
+        if offset:
+            raise
+
+        # `sendfile()` is not supported for these files
+        shutil.copyfileobj(source_fo, destination_fo)
+
+
+def open_unnamed_file(directory):
+    """Return file descriptor of unnamed file in `directory` or `None` if it is not supported (by the OS or the
+    file system)
+    """
+    if not IS_UNNAMED_FILE_SUPPORTED:
+        return None
+
+    try:
+        return os.open(directory, O_TMPFILE | os.O_WRONLY, UNNAMED_FILE_MODE)  # type: ignore
+    except OSError:
+        return None
+
 
 @contextlib.contextmanager
-def atomic_write_append(file_path, mode, **kwargs):
+def atomic_write_unnamed(fd, file_path, mode, file_mode=None):
+    # The file has no name until it is linked, so it just vanishes on error (no temporary file to clean up)
+    with os.fdopen(fd, mode) as fo:
+        yield fo
+        fo.flush()
+        if file_mode is not None:
+            os.fchmod(fd, file_mode)
+        os.fsync(fd)
+
+        directory, filename = os.path.split(file_path)
+        directory_fd = os.open(directory or '.', os.O_RDONLY)
+        try:
+            # Directory file descriptor makes `os.link()` use `linkat()` that can follow /proc/self/fd/* link.
+            # Like `atomicwrites.atomic_write()` we do not overwrite existing file (`FileExistsError` is raised)
+            os.link(f'{PROC_SELF_FD}/{fd}', filename, dst_dir_fd=directory_fd, follow_symlinks=True)
+            os.fsync(directory_fd)  # ensure that file name is written to disk
+        finally:
+            os.close(directory_fd)
+
+
+@contextlib.contextmanager
+def atomic_write_append(file_path, mode, file_mode=None, **kwargs):
+    """Atomically write or append to file. If `file_mode` is given the file gets it along with the data
+    (it is set on the temporary file descriptor, so no path based `chmod()` is needed afterwards)
+    """
     append = 'a' in mode
+    if not append:
+        # Unnamed file does not require creating and removing temporary directory entry
+        fd = open_unnamed_file(os.path.dirname(file_path) or '.')
+        if fd is not None:
+            with atomic_write_unnamed(fd, file_path, mode, file_mode=file_mode) as fo:
+                yield fo
+            return
+
     if append:
         kwargs.setdefault('overwrite', True)
     with atomicwrites.atomic_write(file_path, mode=mode.replace('a', 'w'), **kwargs) as fo:
-        # TODO(abo) MEDIUM: append may be slow, probably switch to OS-level file copying
         if append and Path(file_path).exists():
             with open(file_path, 'rb' if 'b' in mode else 'r') as cur_fo:
-                shutil.copyfileobj(cur_fo, fo)
+                copy_file_data(cur_fo, fo)
         yield fo
+        if file_mode is not None:
+            os.fchmod(fo.fileno(), file_mode)
@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from typing import Union
 
 
@@ -15,11 +16,40 @@ def deep_update(base_dict, update_with):
     return base_dict
 
 
-def replace_keys(source: Union[dict, list], replace_map: dict):
+def replace_keys(source: Union[dict, list, tuple], replace_map: dict):
     if isinstance(source, dict):
         return {replace_map.get(key, key): replace_keys(value, replace_map) for key, value in source.items()}
 
     if isinstance(source, list):
         return [replace_keys(item, replace_map) for item in source]
 
+    if isinstance(source, tuple):
+        return tuple(replace_keys(item, replace_map) for item in source)
+
     return source
+
+
+class LRUCache(OrderedDict):
+    """
+    Least recently used cache that relies on `OrderedDict` (implemented in C) to reorder and evict items in O(1)
+    """
+
+    def __init__(self, maxsize):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get(self, key, default=None):
+        # We do not override `__getitem__()` since `OrderedDict` uses it internally (for instance, in `popitem()`)
+        try:
+            value = self[key]
+        except KeyError:
+            return default
+
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
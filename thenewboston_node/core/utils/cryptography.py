@@ -14,6 +14,11 @@ class KeyPair(NamedTuple):
     private: hexstr
 
 
+# Normalized representation is signed and hashed, so it must stay byte-for-byte stable (ASCII-only output with
+# sorted keys and no whitespace). The encoder is created once instead of on every `json.dumps()` call
+NORMALIZING_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'), sort_keys=True)
+
+
 def generate_signature(signing_key: hexstr, message: bytes) -> hexstr:
     return SigningKey(hex_to_bytes(signing_key)).sign(message).signature.hex()
 
@@ -38,7 +43,7 @@ def is_signature_valid(verify_key: hexstr, message: bytes, signature: hexstr) ->
 
 
 def normalize_dict(dict_: dict) -> bytes:
-    return json.dumps(dict_, separators=(',', ':'), sort_keys=True).encode('utf-8')
+    return NORMALIZING_JSON_ENCODER.encode(dict_).encode('utf-8')
 
 
 def hash_normalized_dict(normalized_dict: bytes) -> hexstr:
@@ -73,6 +73,11 @@ def coerce_from_json_type(value, type_):
 
 
 def is_valid_url(source):
+    # URL must have both scheme and network location, so file paths (the common case) are rejected without
+    # parsing them
+    if isinstance(source, str) and '://' not in source:
+        return False
+
     try:
         parsed = urlparse(source)
         return all((parsed.scheme, parsed.netloc, parsed.path))
@@ -7,6 +7,7 @@ NODE_SIGNING_KEY = NotImplemented
 NODE_SCHEME = 'http'
 NODE_PORT = 8555
 APPEND_AUTO_DETECTED_NETWORK_ADDRESS = True
+NODE_STUN_CACHE_TTL = 300  # seconds
 NODE_NETWORK_ADDRESSES: list[str] = []
 NODE_FEE_AMOUNT = 3
 NODE_FEE_ACCOUNT = None